@@ -0,0 +1,4 @@
+#!/usr/bin/env python3
+
+# Makes the top-level packages (gates, optimizer, ...) importable by
+# the tests when pytest is run without python -m.
@@ -41,7 +41,7 @@ from gates import (
     SwapLayer,
     CH,
 )
-from ga import GA, GAParams
+from ga import GA, GAParams, AbstractionLearning
 from fitness import (
     Fitness,
     Jensensshannon,
@@ -61,18 +61,13 @@ from optimizer import (
     NumericalOptimizer,
 )
 from utils.logging import (
-    log_experiment_details,
-    log_fitness,
-    log_event,
+    ExperimentLogger,
     GATE_ADDED_EVENT,
     ALGORITHM_RESTART_EVENT,
 )
 from gates.utils import extract_ngram_types, get_unique_chomosomes, construct_ngram_name
 from utils.formatting import state_to_distribution
 
-# TODO: move to utils folder
-from .grover_3qubits import compute_bigram_correlations
-
 # Place experiment id creation outside of main function
 # to avoid having to pass it through multiple layer of
 # nested function calls.
@@ -176,9 +171,11 @@ def run_bernstein_vazirani(
 
     genetic_algorithm = GA(gate_set, fitness, optimizer, params=ga_params)
 
-    log_experiment_details(
+    logger = ExperimentLogger(EXPERIMENT_ID)
+    logger.attach(genetic_algorithm)
+
+    logger.log_experiment_details(
         ga=genetic_algorithm,
-        experiment_id=EXPERIMENT_ID,
         target_path="results/experiments.csv",
         description=DESCRIPTION,
     )
@@ -196,8 +193,7 @@ def run_bernstein_vazirani(
 
         mean_fitness_values.append(mean_fitness_value)
 
-        log_fitness(
-            experiment_id=EXPERIMENT_ID,
+        logger.log_fitness(
             generation=generation,
             best_fitness_value=best_fitness_value,
             mean_fitness_value=mean_fitness_value,
@@ -205,9 +201,20 @@ def run_bernstein_vazirani(
             target_path="results/fitness_values.csv",
         )
 
+    def log_gate_added_callback(
+        NewCombinedGate: CombinedGateConstructor, message: str
+    ) -> None:
+        logger.log_event(
+            event_type=GATE_ADDED_EVENT,
+            payload=message,
+            target_path="results/events.csv",
+        )
+
     if abstraction_learning:
-        genetic_algorithm.on_after_generation(compute_bigram_correlations)
-    genetic_algorithm.on_after_generation(log_fitness_callback)
+        genetic_algorithm.on_after_generation(
+            AbstractionLearning(on_gate_added=log_gate_added_callback)
+        )
+    genetic_algorithm.on_after_generation(log_fitness_callback, async_safe=True)
 
     genetic_algorithm.run()
 
@@ -42,8 +42,7 @@ from optimizer import (
     build_circuit,
 )
 from utils.logging import (
-    log_experiment_details,
-    log_fitness,
+    ExperimentLogger,
 )
 
 # Place experiment id creation outside of main function
@@ -224,9 +223,11 @@ def run_deutsch():
 
     genetic_algorithm = GA(gate_set, fitness, optimizer, params=ga_params)
 
-    log_experiment_details(
+    logger = ExperimentLogger(EXPERIMENT_ID)
+    logger.attach(genetic_algorithm)
+
+    logger.log_experiment_details(
         ga=genetic_algorithm,
-        experiment_id=EXPERIMENT_ID,
         target_path="results/experiments.csv",
     )
 
@@ -239,8 +240,7 @@ def run_deutsch():
         best_chromosome, best_fitness_value = ga.get_best_chromosomes(1)[0]
         mean_fitness_value = mean(fitness_values)
 
-        log_fitness(
-            experiment_id=EXPERIMENT_ID,
+        logger.log_fitness(
             generation=generation,
             best_fitness_value=best_fitness_value,
             mean_fitness_value=mean_fitness_value,
@@ -248,7 +248,7 @@ def run_deutsch():
             target_path="results/fitness_values.csv",
         )
 
-    genetic_algorithm.on_after_generation(log_fitness_callback)
+    genetic_algorithm.on_after_generation(log_fitness_callback, async_safe=True)
 
     genetic_algorithm.run()
 
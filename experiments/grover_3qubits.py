@@ -41,7 +41,7 @@ from gates import (
     SwapLayer,
     CH,
 )
-from ga import GA, GAParams
+from ga import GA, GAParams, AbstractionLearning
 from fitness import (
     Fitness,
     Jensensshannon,
@@ -61,13 +61,10 @@ from optimizer import (
     NumericalOptimizer,
 )
 from utils.logging import (
-    log_experiment_details,
-    log_fitness,
-    log_event,
+    ExperimentLogger,
     GATE_ADDED_EVENT,
     ALGORITHM_RESTART_EVENT,
 )
-from gates.utils import extract_ngram_types, get_unique_chomosomes, construct_ngram_name
 from utils.formatting import state_to_distribution
 
 # Place experiment id creation outside of main function
@@ -99,104 +96,6 @@ def construct_oracle_circuit(target_state: List[int]) -> Circuit:
     return circuit
 
 
-def compute_bigram_correlations(
-    ga: GA,
-    population: List[List[Gate]],
-    fitness_values: List[float],
-    generation: int,
-) -> None:
-    population = [ga.toolbox.clone(ind) for ind in population]
-
-    # Get unique chromosomes and recompute fitness values to avoid
-    # distorted correlation computation due to high amount of
-    # duplicates in the population.
-    unique_chromosomes = get_unique_chomosomes(population)
-    fitness_values = [chromosome.fitness.values[0] for chromosome in unique_chromosomes]
-
-    bigrams = {}
-    bigram_types = {}
-
-    # Note: in the gate_set we have constructor classes, while
-    # the chromosomes themselves contain the constructed gates.
-    # Since combined gates require the constructor classes,
-    # bigram_types are collected here. The construct_ngram_name
-    # makes sure that both classes and instances are mapped to
-    # the same name space.
-    for gate1 in ga.gate_set.gates:
-        if type(gate1) == Identity:
-            continue
-
-        for gate2 in ga.gate_set.gates:
-            if type(gate2) == Identity:
-                continue
-
-            bigram = construct_ngram_name([gate1, gate2])
-
-            bigrams[bigram] = []
-            bigram_types[bigram] = extract_ngram_types([gate1, gate2])
-
-    for chromosome in unique_chromosomes:
-        chromosome_bigrams = set()
-
-        for i in range(len(chromosome) - 1):
-            gate = chromosome[i]
-            successor_gate = chromosome[i + 1]
-
-            if type(gate) == Identity or type(successor_gate) == Identity:
-                continue
-
-            bigram = construct_ngram_name([gate, successor_gate])
-            chromosome_bigrams.add(bigram)
-
-        for bigram in bigrams:
-            if bigram in chromosome_bigrams:
-                bigrams[bigram].append(1)
-            else:
-                bigrams[bigram].append(0)
-
-    for bigram in bigrams:
-
-        # Check for arbitrary support level
-        if sum(bigrams[bigram]) < len(unique_chromosomes) * 0.05:
-            continue
-
-        elif np.std(bigrams[bigram]) == 0:
-            if bigrams[bigram][0] == 0:
-                # not present in any chromosome
-                pass
-            else:
-
-                NewCombinedGate = CombinedGateConstructor(bigram_types[bigram])
-
-                if not ga.gate_set.contains(NewCombinedGate):
-                    ga.gate_set.append(NewCombinedGate)
-
-                    log_event(
-                        experiment_id=EXPERIMENT_ID,
-                        event_type=GATE_ADDED_EVENT,
-                        payload=f"Creating {bigram} as separate gate due to presence in every chromosome.",
-                        target_path="results/events.csv",
-                    )
-
-        else:
-            correlation = np.corrcoef(bigrams[bigram], fitness_values)[0, 1]
-
-            # Look for negative correlation, since lower fitness values are better
-            if correlation < -0.25:
-
-                NewCombinedGate = CombinedGateConstructor(bigram_types[bigram])
-
-                if not ga.gate_set.contains(NewCombinedGate):
-                    ga.gate_set.append(NewCombinedGate)
-
-                    log_event(
-                        experiment_id=EXPERIMENT_ID,
-                        event_type=GATE_ADDED_EVENT,
-                        payload=f"Creating {bigram} as separate gate due to fitness correlation of {correlation}.",
-                        target_path="results/events.csv",
-                    )
-
-
 def run_grover(
     FitnessFunction: Type[Fitness] = BaselineFitness, abstraction_learning: bool = False
 ):
@@ -279,9 +178,11 @@ def run_grover(
 
     genetic_algorithm = GA(gate_set, fitness, optimizer, params=ga_params)
 
-    log_experiment_details(
+    logger = ExperimentLogger(EXPERIMENT_ID)
+    logger.attach(genetic_algorithm)
+
+    logger.log_experiment_details(
         ga=genetic_algorithm,
-        experiment_id=EXPERIMENT_ID,
         target_path="results/experiments.csv",
         description=DESCRIPTION,
     )
@@ -299,8 +200,7 @@ def run_grover(
 
         mean_fitness_values.append(mean_fitness_value)
 
-        log_fitness(
-            experiment_id=EXPERIMENT_ID,
+        logger.log_fitness(
             generation=generation,
             best_fitness_value=best_fitness_value,
             mean_fitness_value=mean_fitness_value,
@@ -308,9 +208,20 @@ def run_grover(
             target_path="results/fitness_values.csv",
         )
 
+    def log_gate_added_callback(
+        NewCombinedGate: CombinedGateConstructor, message: str
+    ) -> None:
+        logger.log_event(
+            event_type=GATE_ADDED_EVENT,
+            payload=message,
+            target_path="results/events.csv",
+        )
+
     if abstraction_learning:
-        genetic_algorithm.on_after_generation(compute_bigram_correlations)
-    genetic_algorithm.on_after_generation(log_fitness_callback)
+        genetic_algorithm.on_after_generation(
+            AbstractionLearning(on_gate_added=log_gate_added_callback)
+        )
+    genetic_algorithm.on_after_generation(log_fitness_callback, async_safe=True)
 
     genetic_algorithm.run()
 
@@ -2,10 +2,13 @@
 
 from typing import List, Type
 
-from gates import Gate, Identity, CombinedGate
+from gates import Gate, Identity, CombinedGate, CompiledChromosome
 
 
 def count_gates(chromosome: List[Gate]) -> int:
+    if type(chromosome) == CompiledChromosome:
+        return chromosome.gate_count
+
     return sum([gate.gate_count for gate in chromosome])
 
 
@@ -25,6 +28,13 @@ def count_gate_types(chromosome: List[Gate]) -> int:
 
 
 def contains_gate_type(chromosome: List[Gate], GateTypes: List[Type]) -> bool:
+    if type(chromosome) == CompiledChromosome:
+        for GateType in GateTypes:
+            if chromosome.gate_type_counts[GateType] > 0:
+                return True
+
+        return False
+
     for gate in chromosome:
         if type(gate) in GateTypes:
             return True
@@ -38,6 +48,9 @@ def contains_gate_type(chromosome: List[Gate], GateTypes: List[Type]) -> bool:
 
 
 def count_gate_calls(chromosome: List[Gate], GateType: Type) -> int:
+    if type(chromosome) == CompiledChromosome:
+        return chromosome.gate_type_counts[GateType]
+
     count = 0
 
     for gate in chromosome:
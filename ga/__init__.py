@@ -1,3 +1,5 @@
-
 from .ga import GA
-from .params import GAParams
+from .params import GAParams, IslandParams, SteadyStateParams
+from .island_ga import IslandGA
+from .steady_state_ga import SteadyStateGA
+from .abstraction_learning import AbstractionLearning, BigramStatistics
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from typing import Any, Callable, Dict, List, Tuple
+
+from gates import Gate, GateSet, Identity, CombinedGateConstructor
+from gates.utils import construct_ngram_name, extract_ngram_types
+
+# A bigram has to occur in at least this share of the unique
+# chromosomes to be taken into account.
+SUPPORT_THRESHOLD: float = 0.05
+# Bigrams whose presence correlates with the fitness values below
+# this threshold are added to the gate set. Since lower fitness
+# values are better, negative correlations indicate useful bigrams.
+CORRELATION_THRESHOLD: float = -0.25
+
+
+class BigramStatistics:
+    """Statistics on the bigrams (pairs of consecutive gates) of the
+    unique chromosomes of a population.
+
+    The presence of bigrams is collected in a sparse incidence matrix
+    of unique chromosomes by bigrams, from which the support and the
+    correlation with the fitness values of all bigrams are computed
+    in one matrix operation.
+
+    If incremental, the bigrams of each unique chromosome are
+    extracted only once and reused for as long as the chromosome
+    remains in the population, so that only the chromosomes that
+    are new in a generation have to be processed.
+
+    Chromosomes and bigrams are identified by the interned gate type
+    ids of the gate set (see GateSet.ngram_ids), so that no names
+    have to be built for them.
+    """
+
+    incremental: bool
+
+    def __init__(self, incremental: bool = True) -> None:
+        self.incremental = incremental
+
+        # Interned ids of all bigrams encountered, by the gate type
+        # ids of their gates.
+        self._bigram_ids: Dict[Tuple[int, ...], int] = {}
+        # Bigram ids of unique chromosomes, by the ngram ids of their gates.
+        self._chromosome_bigrams: Dict[Tuple[Tuple[int, ...], ...], np.ndarray] = {}
+
+        # Gate type ids are specific to a gate set.
+        self._gate_set: GateSet = None
+        self._candidates: Tuple[int, List[Tuple[int, ...]], List[str], List[List[Any]]] = None
+
+    def compute(
+        self, gate_set: GateSet, population: List[List[Gate]]
+    ) -> Tuple[List[str], List[List[Any]], np.ndarray, np.ndarray, int]:
+        """Return the names and gate types of all bigrams that can be
+        constructed from the gate set along with their support (number
+        of unique chromosomes containing them), their correlation with
+        the fitness values of those chromosomes and the number of
+        unique chromosomes.
+        """
+        if gate_set is not self._gate_set:
+            self._gate_set = gate_set
+            self._bigram_ids = {}
+            self._chromosome_bigrams = {}
+            self._candidates = None
+
+        bigram_keys, bigram_names, bigram_types = self._get_candidates(gate_set)
+
+        # Keep the best of duplicate chromosomes (see
+        # gates.utils.get_unique_chomosomes).
+        unique_chromosomes: Dict[
+            Tuple[int, ...], Tuple[Tuple[Tuple[int, ...], ...], List[Gate]]
+        ] = {}
+        for chromosome in population:
+            gene_ids = tuple([gate_set.ngram_ids(gate) for gate in chromosome])
+            signature = sum(gene_ids, ())
+
+            if (
+                signature not in unique_chromosomes
+                or unique_chromosomes[signature][1].fitness.values[0]
+                > chromosome.fitness.values[0]
+            ):
+                unique_chromosomes[signature] = (gene_ids, chromosome)
+
+        chromosome_bigrams = {}
+        for gene_ids, chromosome in unique_chromosomes.values():
+            if gene_ids in self._chromosome_bigrams:
+                chromosome_bigrams[gene_ids] = self._chromosome_bigrams[gene_ids]
+            else:
+                chromosome_bigrams[gene_ids] = self._extract_bigrams(
+                    chromosome, gene_ids
+                )
+
+        if self.incremental:
+            # Chromosomes that have left the population are dropped.
+            self._chromosome_bigrams = chromosome_bigrams
+
+        # Map interned bigram ids onto the columns of the candidates.
+        columns = np.full(len(self._bigram_ids), -1, dtype=int)
+        for column, bigram_key in enumerate(bigram_keys):
+            if bigram_key in self._bigram_ids:
+                columns[self._bigram_ids[bigram_key]] = column
+
+        rows = []
+        cols = []
+        for row, (gene_ids, _) in enumerate(unique_chromosomes.values()):
+            bigram_ids = chromosome_bigrams[gene_ids]
+            bigram_columns = columns[bigram_ids]
+            bigram_columns = bigram_columns[bigram_columns >= 0]
+
+            rows.append(np.full(len(bigram_columns), row, dtype=int))
+            cols.append(bigram_columns)
+
+        chromosome_count = len(unique_chromosomes)
+        rows = np.concatenate(rows) if len(rows) > 0 else np.empty(0, dtype=int)
+        cols = np.concatenate(cols) if len(cols) > 0 else np.empty(0, dtype=int)
+
+        incidence = csr_matrix(
+            (np.ones(len(rows)), (rows, cols)),
+            shape=(chromosome_count, len(bigram_names)),
+        )
+
+        fitness_values = np.array(
+            [
+                chromosome.fitness.values[0]
+                for _, chromosome in unique_chromosomes.values()
+            ],
+            dtype=float,
+        )
+
+        support = np.asarray(incidence.sum(axis=0)).ravel()
+        correlations = self._correlate(incidence, support, fitness_values)
+
+        return bigram_names, bigram_types, support, correlations, chromosome_count
+
+    def _get_candidates(
+        self, gate_set: GateSet
+    ) -> Tuple[List[Tuple[int, ...]], List[str], List[List[Any]]]:
+        # Candidates only change when gate types are added.
+        if self._candidates is not None and self._candidates[0] == len(gate_set.gates):
+            return self._candidates[1:]
+
+        # The gate set contains constructor classes, while chromosomes
+        # contain the constructed gates. GateSet.ngram_ids maps both
+        # to the same ids.
+        bigram_names = {}
+        bigram_types = {}
+
+        for gate1 in gate_set.gates:
+            if gate1 == Identity:
+                continue
+
+            for gate2 in gate_set.gates:
+                if gate2 == Identity:
+                    continue
+
+                bigram_key = gate_set.ngram_ids(gate1) + gate_set.ngram_ids(gate2)
+                bigram_names[bigram_key] = construct_ngram_name([gate1, gate2])
+                bigram_types[bigram_key] = extract_ngram_types([gate1, gate2])
+
+        self._candidates = (
+            len(gate_set.gates),
+            list(bigram_types.keys()),
+            list(bigram_names.values()),
+            list(bigram_types.values()),
+        )
+        return self._candidates[1:]
+
+    def _extract_bigrams(
+        self, chromosome: List[Gate], gene_ids: Tuple[Tuple[int, ...], ...]
+    ) -> np.ndarray:
+        bigram_ids = set()
+
+        for i in range(len(chromosome) - 1):
+            if type(chromosome[i]) == Identity or type(chromosome[i + 1]) == Identity:
+                continue
+
+            # Equals GateSet.ngram_ids of both gates.
+            bigram_key = gene_ids[i] + gene_ids[i + 1]
+
+            if bigram_key not in self._bigram_ids:
+                self._bigram_ids[bigram_key] = len(self._bigram_ids)
+
+            bigram_ids.add(self._bigram_ids[bigram_key])
+
+        return np.array(sorted(bigram_ids), dtype=int)
+
+    def _correlate(
+        self, incidence: csr_matrix, support: np.ndarray, fitness_values: np.ndarray
+    ) -> np.ndarray:
+        """Pearson correlation of every bigram column of the incidence
+        matrix with the fitness values. Undefined (nan) for constant
+        columns or constant fitness values, as with np.corrcoef.
+        """
+        chromosome_count = len(fitness_values)
+        if chromosome_count == 0:
+            return np.full(len(support), np.nan)
+
+        presence_means = support / chromosome_count
+        fitness_mean = fitness_values.mean()
+
+        covariances = (
+            incidence.T @ fitness_values
+        ) / chromosome_count - presence_means * fitness_mean
+
+        # The presence of a bigram is binary, so E[x²] equals E[x].
+        presence_variances = presence_means - presence_means**2
+        fitness_variance = fitness_values.var()
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlations = covariances / np.sqrt(presence_variances * fitness_variance)
+
+        # Rounding can produce tiny non-zero variances for constant columns.
+        correlations[presence_variances <= 0] = np.nan
+        return correlations
+
+
+class AbstractionLearning:
+    """Generation callback that adds bigrams of gates whose presence
+    correlates with good fitness values (or that occur in every
+    unique chromosome) to the gate set as combined gates.
+
+    on_gate_added is called with the new combined gate constructor
+    and a description of why it has been added.
+    """
+
+    # Adds gates to the gate set, so it has to be called before
+    # the next generation starts.
+    async_safe: bool = False
+
+    support_threshold: float
+    correlation_threshold: float
+
+    def __init__(
+        self,
+        support_threshold: float = SUPPORT_THRESHOLD,
+        correlation_threshold: float = CORRELATION_THRESHOLD,
+        incremental: bool = True,
+        on_gate_added: Callable[[CombinedGateConstructor, str], None] = None,
+    ) -> None:
+        self.support_threshold = support_threshold
+        self.correlation_threshold = correlation_threshold
+        self.on_gate_added = on_gate_added
+
+        self.statistics = BigramStatistics(incremental=incremental)
+
+    def __call__(
+        self,
+        ga: Any,
+        population: List[List[Gate]],
+        fitness_values: List[float],
+        generation: int,
+    ) -> None:
+        (
+            bigram_names,
+            bigram_types,
+            support,
+            correlations,
+            chromosome_count,
+        ) = self.statistics.compute(ga.gate_set, population)
+
+        for i, bigram_name in enumerate(bigram_names):
+            # Check for arbitrary support level
+            if support[i] == 0 or support[i] < chromosome_count * self.support_threshold:
+                continue
+
+            if support[i] == chromosome_count:
+                reason = "presence in every chromosome"
+            elif correlations[i] < self.correlation_threshold:
+                reason = f"fitness correlation of {correlations[i]}"
+            else:
+                continue
+
+            NewCombinedGate = CombinedGateConstructor(bigram_types[i])
+
+            if ga.gate_set.contains(NewCombinedGate):
+                continue
+
+            ga.gate_set.append(NewCombinedGate)
+
+            if self.on_gate_added is not None:
+                self.on_gate_added(
+                    NewCombinedGate,
+                    f"Creating {bigram_name} as separate gate due to {reason}.",
+                )
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+from queue import Queue
+from threading import Thread
+from typing import Any, Callable, List, Tuple
+
+from .ranking import Ranking
+from gates import Gate, GateSet
+
+
+class GASnapshot:
+    """Read-only view of the state of a GA at the end of a generation,
+    passed to async-safe generation callbacks in place of the GA.
+
+    The population, its fitness values and the gate set are frozen,
+    so that the GA can evolve the next generation while callbacks
+    are still processing the snapshot.
+    """
+
+    generation: int
+    evolved_population: Tuple[List[Gate], ...]
+    fitness_values: Tuple[float, ...]
+    gate_set: GateSet
+
+    def __init__(
+        self,
+        ga: Any,
+        population: List[List[Gate]],
+        fitness_values: List[float],
+        generation: int,
+    ) -> None:
+        self.generation = generation
+        # Chromosomes are not changed once they have been selected
+        # (offspring are bred from clones), so freezing the list
+        # of them suffices.
+        self.evolved_population = tuple(population)
+        self.fitness_values = tuple(fitness_values)
+        self.gate_set = ga.gate_set.copy()
+
+        self.params = ga.params
+        self.fitness = ga.fitness
+        self.optimizer = ga.optimizer
+
+        self._ga = ga
+        self._ranking = None
+
+    def get_best_chromosomes(self, n: int = 1) -> List[Tuple[List[Gate], float]]:
+        if self._ranking is None:
+            self._ranking = Ranking(self.fitness_values)
+
+        return [
+            (self.evolved_population[i], self.fitness_values[i])
+            for i in self._ranking.best_indices(n)
+        ]
+
+    def stop(self) -> None:
+        """Stop the GA after its current generation."""
+        self._ga.stop()
+
+    def has_been_stopped(self) -> bool:
+        return self._ga.has_been_stopped()
+
+
+class CallbackRunner:
+    """Calls callbacks on a background thread, in the order in which
+    they have been submitted.
+
+    At most backlog calls can be pending, after which submit blocks
+    until the thread has caught up. Errors raised by callbacks are
+    re-raised by the next call to submit, wait or close.
+    """
+
+    backlog: int
+
+    def __init__(self, backlog: int = 2) -> None:
+        self.backlog = backlog
+
+        self._calls = Queue(maxsize=max(backlog, 1))
+        self._thread = None
+        self._error = None
+
+    def submit(self, callback: Callable, *args: Any) -> None:
+        self._raise_error()
+
+        # Started lazily, so that runners can be created before
+        # forking (e.g. for islands).
+        if self._thread is None:
+            self._thread = Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+        self._calls.put((callback, args))
+
+    def wait(self) -> None:
+        """Block until all submitted callbacks have been called."""
+        self._calls.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._calls.put(None)
+            self._thread.join()
+            self._thread = None
+
+        self._raise_error()
+
+    def _run(self) -> None:
+        while True:
+            call = self._calls.get()
+
+            if call is None:
+                self._calls.task_done()
+                return
+
+            callback, args = call
+            try:
+                callback(*args)
+            except BaseException as e:
+                if self._error is None:
+                    self._error = e
+            finally:
+                self._calls.task_done()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
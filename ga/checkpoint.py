@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+from dataclasses import dataclass
+import os
+import pickle
+from threading import Thread
+from typing import Any, Dict, List, Tuple
+import zlib
+
+from gates import Gate, GateSet
+from .utils import create_types
+
+# Checkpoint files start with a magic string and a format version,
+# followed by the zlib-compressed pickle of the checkpoint. Pickle
+# stores shared objects (such as the oracle circuits referenced by
+# the gate set and all oracle gates) only once, and gate classes by
+# reference, which keeps checkpoints compact.
+MAGIC: bytes = b"GP4QC-CHECKPOINT"
+VERSION: int = 1
+
+# Favor write speed over size.
+COMPRESSION_LEVEL: int = 1
+
+
+@dataclass
+class Checkpoint:
+    generation: int
+    population: List[List[Gate]]
+    fitness_values: List[float]
+    # Includes gates added during the run, e.g. combined gates
+    # created by abstraction learning.
+    gate_set: GateSet
+    random_state: Tuple
+    numpy_random_state: Dict[str, Any]
+
+
+def serialize_checkpoint(checkpoint: Checkpoint) -> bytes:
+    return pickle.dumps(checkpoint, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def write_checkpoint(data: bytes, path: str) -> None:
+    """Write a serialized checkpoint. The previous checkpoint at
+    path is only replaced once the new one has been written
+    completely.
+    """
+    directory = os.path.dirname(path)
+    if directory != "":
+        os.makedirs(directory, exist_ok=True)
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as checkpoint_file:
+        checkpoint_file.write(MAGIC)
+        checkpoint_file.write(VERSION.to_bytes(1, "big"))
+        checkpoint_file.write(zlib.compress(data, COMPRESSION_LEVEL))
+
+    os.replace(temporary_path, path)
+
+
+def read_checkpoint(path: str) -> Checkpoint:
+    with open(path, "rb") as checkpoint_file:
+        magic = checkpoint_file.read(len(MAGIC))
+        version = int.from_bytes(checkpoint_file.read(1), "big")
+        data = checkpoint_file.read()
+
+    if magic != MAGIC:
+        raise ValueError(f"'{path}' is not a checkpoint file.")
+
+    if version != VERSION:
+        raise ValueError(f"Unsupported checkpoint version {version}.")
+
+    # Chromosomes can only be deserialized once their types exist.
+    create_types()
+
+    return pickle.loads(zlib.decompress(data))
+
+
+class CheckpointWriter:
+    """Writes checkpoints in the background.
+
+    The checkpoint is serialized immediately, so that later changes
+    to the population or gate set do not leak into it, while
+    compressing and writing it to disk happens on a separate thread.
+    Only one write is in progress at a time.
+    """
+
+    path: str
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._thread = None
+
+    def write(self, checkpoint: Checkpoint) -> None:
+        data = serialize_checkpoint(checkpoint)
+
+        self.wait()
+        self._thread = Thread(target=write_checkpoint, args=(data, self.path))
+        self._thread.start()
+
+    def wait(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
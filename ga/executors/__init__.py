@@ -0,0 +1,4 @@
+from .executor import Executor
+from .pool_executor import PoolExecutor
+from .thread_executor import ThreadExecutor
+from .remote_executor import RemoteExecutor, LocalCluster, run_worker, serve_workers
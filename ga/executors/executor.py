@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable, Iterator, List
+
+
+class Executor(ABC):
+    """Backend used by the genetic algorithm to evaluate chromosomes.
+
+    The function passed to map and imap_unordered as well as the
+    items and results have to be picklable for backends that
+    evaluate outside of the main process.
+    """
+
+    @property
+    @abstractmethod
+    def worker_count(self) -> int:
+        """Number of chromosomes that can be evaluated at the same time."""
+        ...
+
+    @abstractmethod
+    def map(self, function: Callable, items: Iterable[Any]) -> List[Any]:
+        """Apply function to every item and return the results in
+        the order of the items.
+        """
+        ...
+
+    @abstractmethod
+    def imap_unordered(self, function: Callable, items: Iterable[Any]) -> Iterator[Any]:
+        """Apply function to every item and yield the results as
+        soon as they are available.
+        """
+        ...
+
+    @abstractmethod
+    def submit(
+        self,
+        function: Callable,
+        item: Any,
+        callback: Callable[[Any], None],
+        error_callback: Callable[[BaseException], None],
+    ) -> None:
+        """Apply function to item without waiting for the result.
+        Once available, the result (or the raised exception) is
+        passed to callback (or error_callback) from a background
+        thread.
+        """
+        ...
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+    def __enter__(self) -> "Executor":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
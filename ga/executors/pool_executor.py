@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+from multiprocessing import Pool
+from os import cpu_count
+from typing import Any, Callable, Iterable, Iterator, List
+
+from .executor import Executor
+
+
+class PoolExecutor(Executor):
+    """Evaluates on a pool of local processes. The pool is created
+    on first use and kept alive until the executor is closed.
+    """
+
+    processes: int
+
+    def __init__(self, processes: int = None) -> None:
+        self.processes = processes
+        self._pool = None
+
+    @property
+    def worker_count(self) -> int:
+        if self.processes is None:
+            return cpu_count()
+
+        return self.processes
+
+    @property
+    def pool(self) -> Pool:
+        if self._pool is None:
+            self._pool = Pool(processes=self.processes)
+
+        return self._pool
+
+    def map(self, function: Callable, items: Iterable[Any]) -> List[Any]:
+        return self.pool.map(function, items)
+
+    def imap_unordered(self, function: Callable, items: Iterable[Any]) -> Iterator[Any]:
+        return self.pool.imap_unordered(function, items)
+
+    def submit(
+        self,
+        function: Callable,
+        item: Any,
+        callback: Callable[[Any], None],
+        error_callback: Callable[[BaseException], None],
+    ) -> None:
+        self.pool.apply_async(
+            function, (item,), callback=callback, error_callback=error_callback
+        )
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
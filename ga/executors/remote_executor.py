@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+
+import argparse
+from functools import partial
+from itertools import count
+from multiprocessing import Process
+from multiprocessing.connection import Client, Listener
+from os import cpu_count, urandom
+from queue import Queue
+from threading import Lock, Thread
+from typing import Any, Callable, Iterable, Iterator, List, Tuple
+
+from .executor import Executor
+from ..utils import create_types
+
+_SUCCEEDED: str = "SUCCEEDED"
+_FAILED: str = "FAILED"
+
+
+class RemoteExecutor(Executor):
+    """Evaluates on worker processes that connect over the network,
+    possibly from other machines.
+
+    The executor listens on the specified address. Workers (see
+    run_worker and serve_workers) connect to it and pull one
+    serialized task at a time, which keeps fast workers busy and
+    slow workers from holding back a queue of tasks. Tasks of a
+    worker whose connection breaks are handed to other workers.
+
+    Connections are authenticated with the shared authkey. Since
+    tasks and results are unpickled, anyone who knows the authkey
+    can run code on the executor and its workers. If no authkey is
+    specified, a random one is generated, which only workers started
+    through this process (see LocalCluster) know. The executor only
+    listens on the loopback interface unless another host is given.
+
+    If no worker is connected, map and imap_unordered block until
+    one connects. Once a task of a map (or imap_unordered) call
+    fails, the tasks of the call that have not been sent to a
+    worker yet are skipped.
+    """
+
+    address: Tuple[str, int]
+
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 6000, authkey: bytes = None
+    ) -> None:
+        if authkey is None:
+            authkey = urandom(32)
+
+        self._listener = Listener((host, port), authkey=authkey)
+        self.address = self._listener.address
+        self.authkey = authkey
+
+        self._tasks = Queue()
+        self._closed = False
+
+        # Ids of map and imap_unordered calls whose pending tasks
+        # are skipped.
+        self._call_ids = count()
+        self._cancelled_call_ids = set()
+
+        self._connected_count = 0
+        self._connected_count_lock = Lock()
+
+        Thread(target=self._accept_workers, daemon=True).start()
+
+    @property
+    def worker_count(self) -> int:
+        # Tasks are queued until at least one worker connects.
+        return max(self._connected_count, 1)
+
+    def map(self, function: Callable, items: Iterable[Any]) -> List[Any]:
+        indexed_results = list(self._run(function, items))
+        indexed_results.sort(key=lambda indexed_result: indexed_result[0])
+
+        return [result for _, result in indexed_results]
+
+    def imap_unordered(self, function: Callable, items: Iterable[Any]) -> Iterator[Any]:
+        for _, result in self._run(function, items):
+            yield result
+
+    def submit(
+        self,
+        function: Callable,
+        item: Any,
+        callback: Callable[[Any], None],
+        error_callback: Callable[[BaseException], None],
+    ) -> None:
+        assert not self._closed, "The executor has already been closed."
+
+        def on_done(status: str, result: Any) -> None:
+            if status == _FAILED:
+                error_callback(result)
+            else:
+                callback(result)
+
+        self._tasks.put((function, item, on_done, None))
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+
+        # Serving threads pass the sentinel on to each other and
+        # release their workers.
+        self._tasks.put(None)
+        self._listener.close()
+
+    def _run(self, function: Callable, items: Iterable[Any]) -> Iterator[Tuple[int, Any]]:
+        assert not self._closed, "The executor has already been closed."
+
+        results = Queue()
+        call_id = next(self._call_ids)
+
+        task_count = 0
+        for index, item in enumerate(items):
+            on_done = partial(self._put_result, results, index)
+            self._tasks.put((function, item, on_done, call_id))
+            task_count += 1
+
+        result_count = 0
+        try:
+            for _ in range(task_count):
+                index, status, result = results.get()
+
+                if status == _FAILED:
+                    raise result
+
+                result_count += 1
+                yield index, result
+        finally:
+            # Raised or abandoned by the caller.
+            if result_count < task_count:
+                self._cancelled_call_ids.add(call_id)
+
+    @staticmethod
+    def _put_result(results: Queue, index: int, status: str, result: Any) -> None:
+        results.put((index, status, result))
+
+    def _accept_workers(self) -> None:
+        while not self._closed:
+            try:
+                connection = self._listener.accept()
+            except Exception:
+                # Raised on closing the listener as well as on failed
+                # authentications.
+                continue
+
+            Thread(target=self._serve_worker, args=(connection,), daemon=True).start()
+
+    def _serve_worker(self, connection) -> None:
+        with self._connected_count_lock:
+            self._connected_count += 1
+
+        try:
+            self._serve_tasks(connection)
+        finally:
+            with self._connected_count_lock:
+                self._connected_count -= 1
+
+    def _serve_tasks(self, connection) -> None:
+        while True:
+            task = self._tasks.get()
+
+            if task is None:
+                self._tasks.put(None)
+
+                try:
+                    connection.send(None)
+                except OSError:
+                    pass
+
+                connection.close()
+                return
+
+            function, item, on_done, call_id = task
+            if call_id in self._cancelled_call_ids:
+                continue
+
+            try:
+                connection.send((function, item))
+                status, result = connection.recv()
+            except (OSError, EOFError):
+                # Hand the task to another worker.
+                self._tasks.put(task)
+                connection.close()
+                return
+
+            on_done(status, result)
+
+
+def run_worker(address: Tuple[str, int], authkey: bytes) -> None:
+    """Connect to a remote executor and evaluate tasks until the
+    executor is closed.
+    """
+
+    # Chromosomes can only be deserialized once their types exist.
+    create_types()
+
+    connection = Client(address, authkey=authkey)
+
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            break
+
+        if task is None:
+            break
+
+        function, item = task
+
+        try:
+            message = (_SUCCEEDED, function(item))
+        except Exception as e:
+            message = (_FAILED, e)
+
+        try:
+            connection.send(message)
+        except OSError:
+            break
+
+    connection.close()
+
+
+def serve_workers(
+    address: Tuple[str, int], authkey: bytes, processes: int = None
+) -> List[Process]:
+    """Start one worker process per core (or the specified number)
+    that connects to the remote executor at address.
+    """
+    if processes is None:
+        processes = cpu_count()
+
+    workers = [
+        Process(target=run_worker, args=(address, authkey), daemon=True)
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    return workers
+
+
+class LocalCluster:
+    """Stand-in for a cluster of remote machines. Starts worker
+    processes on the local machine that connect to the specified
+    remote executor.
+    """
+
+    def __init__(self, executor: RemoteExecutor, worker_count: int = None) -> None:
+        host, port = executor.address
+        if host == "0.0.0.0":
+            host = "127.0.0.1"
+
+        self._workers = serve_workers(
+            (host, port), authkey=executor.authkey, processes=worker_count
+        )
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.join(timeout=1)
+
+            if worker.is_alive():
+                worker.terminate()
+
+    def __enter__(self) -> "LocalCluster":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Evaluate chromosomes for a remote executor."
+    )
+    parser.add_argument("--host", required=True)
+    parser.add_argument("--port", type=int, default=6000)
+    parser.add_argument("--authkey", required=True)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    workers = serve_workers(
+        (args.host, args.port),
+        authkey=args.authkey.encode(),
+        processes=args.processes,
+    )
+    for worker in workers:
+        worker.join()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+from multiprocessing.pool import ThreadPool
+from os import cpu_count
+from typing import Any, Callable, Iterable, Iterator, List
+
+from .executor import Executor
+
+
+class ThreadExecutor(Executor):
+    """Evaluates on a pool of threads within the main process.
+    Avoids pickling chromosomes, but is limited by the global
+    interpreter lock for pure Python workloads.
+    """
+
+    threads: int
+
+    def __init__(self, threads: int = None) -> None:
+        self.threads = threads
+        self._pool = None
+
+    @property
+    def worker_count(self) -> int:
+        if self.threads is None:
+            return cpu_count()
+
+        return self.threads
+
+    @property
+    def pool(self) -> ThreadPool:
+        if self._pool is None:
+            self._pool = ThreadPool(processes=self.threads)
+
+        return self._pool
+
+    def map(self, function: Callable, items: Iterable[Any]) -> List[Any]:
+        return self.pool.map(function, items)
+
+    def imap_unordered(self, function: Callable, items: Iterable[Any]) -> Iterator[Any]:
+        return self.pool.imap_unordered(function, items)
+
+    def submit(
+        self,
+        function: Callable,
+        item: Any,
+        callback: Callable[[Any], None],
+        error_callback: Callable[[BaseException], None],
+    ) -> None:
+        self.pool.apply_async(
+            function, (item,), callback=callback, error_callback=error_callback
+        )
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
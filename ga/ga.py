@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
+from functools import partial
 from math import floor
-from multiprocessing import Pool
+import numpy as np
 import os
 import random
 from statistics import mean
@@ -9,6 +10,20 @@ from typing import Any, List, Tuple, Callable
 import warnings
 
 from .params import GAParams, default_params
+from .ranking import Ranking
+from .selection import select
+from .scheduling import SchedulingReport, map_scheduled
+from .checkpoint import Checkpoint, CheckpointWriter, read_checkpoint
+from .seeding import (
+    GENERATOR_STREAM,
+    RANDOM_STREAM,
+    TASK_STREAM,
+    create_seed_sequence,
+    run_seeded,
+    seed_random,
+)
+from .executors import Executor, PoolExecutor
+from .callbacks import CallbackRunner, GASnapshot
 from gates import Gate, GateSet
 from .utils import init_toolbox
 from fitness import Fitness
@@ -21,8 +36,15 @@ class GA:
     gate_set: GateSet
 
     evolved_population: List[Gate]
+    _ranking: Ranking
+    _rng: np.random.Generator
+    _seed_key: Tuple[int, ...]
+    _executor: Executor
+    scheduling_report: SchedulingReport
     _after_generation_callbacks: List[Callable]
+    _async_after_generation_callbacks: List[Callable]
     _on_completion_callbacks: List[Callable]
+    _callback_runner: CallbackRunner
 
     _stopped: bool
 
@@ -32,19 +54,49 @@ class GA:
         fitness: Fitness,
         optimizer: Optimizer,
         params: GAParams = default_params,
+        executor: Executor = None,
     ) -> None:
+        """If no executor is specified, chromosomes are evaluated
+        on a pool of params.cpu_count local processes.
+        """
         self.evolved_population = []
+        self._ranking = None
+        self._rng = None
+        self._seed_key = ()
+        self._executor = None
+        self.scheduling_report = None
         self._after_generation_callbacks = []
+        self._async_after_generation_callbacks = []
         self._on_completion_callbacks = []
+        self._callback_runner = None
         self._stopped = False
 
         self.gate_set = gate_set
         self.fitness = fitness
         self.optimizer = optimizer
         self.params = params
-
-    def on_after_generation(self, callback: Callable) -> None:
-        self._after_generation_callbacks.append(callback)
+        self.executor = executor
+
+    def on_after_generation(self, callback: Callable, async_safe: bool = None) -> None:
+        """Register a callback that is called after every generation
+        with the GA, the population, its fitness values and the
+        generation.
+
+        Async-safe callbacks are called on a background thread with
+        a GASnapshot in place of the GA, while the next generation
+        is evolved. Callbacks that change the GA or its gate set
+        (e.g. AbstractionLearning) must not be async-safe; they are
+        called before the next generation starts. If async_safe is
+        not specified, it is taken from the async_safe attribute of
+        the callback, if any.
+        """
+        if async_safe is None:
+            async_safe = getattr(callback, "async_safe", False)
+
+        if async_safe:
+            self._async_after_generation_callbacks.append(callback)
+        else:
+            self._after_generation_callbacks.append(callback)
 
     def on_completion(self, callback: Callable) -> None:
         self._on_completion_callbacks.append(callback)
@@ -54,99 +106,315 @@ class GA:
 
     def run(self):
         self._stopped = False
+        self._setup()
+
+        population = self.toolbox.population(n=self.params.population_size)
+
+        self._run_generations(population, first_generation=1)
+
+    def resume(self, checkpoint_path: str):
+        """Continue a run from the state stored in a checkpoint,
+        including the gate set and random states, so that the
+        remaining generations evolve exactly as they would have
+        without interruption.
+        """
+        checkpoint = read_checkpoint(checkpoint_path)
+
+        self._stopped = False
+        self.gate_set = checkpoint.gate_set
+        self._setup()
+
+        random.setstate(checkpoint.random_state)
+        self._rng.bit_generator.state = checkpoint.numpy_random_state
+
+        population = checkpoint.population
+        self._set_population(population, checkpoint.fitness_values)
+
+        self._run_generations(population, first_generation=checkpoint.generation + 1)
+
+    def _run_generations(
+        self, population: List[List[Gate]], first_generation: int
+    ) -> None:
+        generation = first_generation - 1
 
+        checkpoint_writer = None
+        if self.params.checkpoint_path is not None:
+            checkpoint_writer = CheckpointWriter(self.params.checkpoint_path)
+
+        try:
+            for generation in range(first_generation, self.params.generations + 1):
+                if self._stopped:
+                    break
+
+                population, fitness_values = self._evolve(population, generation)
+
+                if self._after_generation(population, fitness_values, generation):
+                    break
+
+                if (
+                    checkpoint_writer is not None
+                    and generation % self.params.checkpoint_interval == 0
+                ):
+                    checkpoint_writer.write(
+                        self._create_checkpoint(population, fitness_values, generation)
+                    )
+        finally:
+            if checkpoint_writer is not None:
+                checkpoint_writer.wait()
+
+            self._teardown()
+
+        self._complete(population, generation)
+
+    def _setup(self) -> None:
         # Catch reinitialization warning if multiple GAs are used
         # in one run.
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            self.toolbox = toolbox = init_toolbox(
+            self.toolbox = init_toolbox(
                 self.gate_set,
                 self.params.chromosome_length,
                 self.fitness,
                 self.optimizer,
             )
 
-        population = toolbox.population(n=self.params.population_size)
+        self._seed()
+
+        self._callback_runner = CallbackRunner(backlog=self.params.callback_backlog)
+
+        if self.executor is not None:
+            self._executor = self.executor
+        else:
+            self._executor = self._create_executor()
+
+    def _create_executor(self) -> Executor:
+        return PoolExecutor(processes=self.params.cpu_count)
+
+    def _seed(self) -> None:
+        if self.params.seed is None:
+            self._rng = np.random.default_rng()
+            return
+
+        seed_random(
+            create_seed_sequence(self.params.seed, *self._seed_key, RANDOM_STREAM)
+        )
+        self._rng = np.random.default_rng(
+            create_seed_sequence(self.params.seed, *self._seed_key, GENERATOR_STREAM)
+        )
+
+    def _teardown(self) -> None:
+        try:
+            # Pending async-safe callbacks are completed before
+            # completion callbacks are called.
+            self._callback_runner.close()
+        finally:
+            # Only close executors that have been created by the GA itself.
+            if self._executor is not self.executor:
+                self._executor.close()
+
+            self._executor = None
+
+    def _evolve(
+        self, population: List[List[Gate]], generation: int
+    ) -> Tuple[List[List[Gate]], List[float]]:
+        """Breed, evaluate and select the population of the
+        next generation.
+        """
+        toolbox = self.toolbox
+
+        if generation == 1:
+            elite = []
+        else:
+            elite = [
+                population[i]
+                for i in self._ranking.best_indices(self.params.elitism_count)
+            ]
+            # Create deep copy to avoid adjusting elite chromosomes through mutation
+            elite = [toolbox.clone(ind) for ind in elite]
+
+        offspring = [toolbox.clone(ind) for ind in population]
+        random.shuffle(offspring)
+
+        offspring = self._vary(offspring)
+        offspring = self._evaluate(offspring, generation)
+
+        offspring_fitness_values = np.fromiter(
+            (chromosome.fitness.values[0] for chromosome in offspring),
+            dtype=float,
+            count=len(offspring),
+        )
+        selected_indices = select(
+            offspring_fitness_values,
+            k=self.params.population_size - len(elite),
+            method=self.params.selection_method,
+            tournament_size=self.params.tournament_size,
+            rng=self._rng,
+        )
+        population = elite + [offspring[i] for i in selected_indices]
+        fitness_values = [
+            chromosome.fitness.values[0] for chromosome in elite
+        ] + offspring_fitness_values[selected_indices].tolist()
+
+        self._set_population(population, fitness_values)
+        return population, fitness_values
 
-        for generation in range(1, self.params.generations + 1):
-            if self._stopped:
-                break
+    def _vary(self, offspring: List[List[Gate]]) -> List[List[Gate]]:
+        """Apply crossover and mutations to (cloned) offspring."""
+        toolbox = self.toolbox
 
-            if generation == 1:
-                elite = []
-            else:
-                elite = toolbox.select_best(population, k=self.params.elitism_count)
-                # Create deep copy to avoid adjusting elite chromosomes through mutation
-                elite = [toolbox.clone(ind) for ind in elite]
+        for i in range(1, len(offspring), 2):
+            if random.random() < self.params.crossover_prob:
+                offspring[i - 1], offspring[i] = toolbox.mate(
+                    offspring[i - 1], offspring[i]
+                )
+
+        if self.params.swap_gate_mutation_prob > 0:
+            for i in range(len(offspring)):
+                for j in range(len(offspring[i])):
+                    if random.random() < self.params.swap_gate_mutation_prob:
+                        offspring[i] = toolbox.swap_gate_mutate(
+                            offspring[i], gate_idx=j
+                        )
+
+        if self.params.operand_mutation_prob > 0:
+            for i in range(len(offspring)):
+                for j in range(len(offspring[i])):
+                    if random.random() < self.params.operand_mutation_prob:
+                        offspring[i] = toolbox.operand_mutate(
+                            offspring[i], gate_idx=j
+                        )
+
+        if self.params.swap_order_mutation_prob > 0:
+            for i in range(len(offspring)):
+                for j in range(len(offspring[i])):
+                    if random.random() < self.params.swap_order_mutation_prob:
+                        offspring[i] = toolbox.swap_order_mutate(
+                            offspring[i], gate1_idx=j
+                        )
+
+        return offspring
+
+    def _evaluate(
+        self, offspring: List[List[Gate]], generation: int
+    ) -> List[List[Gate]]:
+        costs = [self.optimizer.estimate_cost(chromosome) for chromosome in offspring]
+
+        if self.params.seed is None:
+            offspring, self.scheduling_report = map_scheduled(
+                self._executor, self.toolbox.evaluate, offspring, costs
+            )
+            return offspring
+
+        # Each task gets its own random stream, identified by its
+        # position in the offspring rather than the worker it runs on.
+        tasks = [
+            (
+                create_seed_sequence(
+                    self.params.seed, *self._seed_key, TASK_STREAM, generation, i
+                ),
+                chromosome,
+            )
+            for i, chromosome in enumerate(offspring)
+        ]
 
-            offspring = [toolbox.clone(ind) for ind in population]
-            random.shuffle(offspring)
+        # Executors that run tasks within the main process reseed
+        # its random state.
+        random_state = random.getstate()
+        numpy_random_state = np.random.get_state()
 
-            for i in range(1, len(offspring), 2):
-                if random.random() < self.params.crossover_prob:
-                    offspring[i - 1], offspring[i] = toolbox.mate(
-                        offspring[i - 1], offspring[i]
-                    )
+        offspring, self.scheduling_report = map_scheduled(
+            self._executor, partial(run_seeded, self.toolbox.evaluate), tasks, costs
+        )
 
-            if self.params.swap_gate_mutation_prob > 0:
-                for i in range(len(offspring)):
-                    for j in range(len(offspring[i])):
-                        if random.random() < self.params.swap_gate_mutation_prob:
-                            offspring[i] = toolbox.swap_gate_mutate(
-                                offspring[i], gate_idx=j
-                            )
-
-            if self.params.operand_mutation_prob > 0:
-                for i in range(len(offspring)):
-                    for j in range(len(offspring[i])):
-                        if random.random() < self.params.operand_mutation_prob:
-                            offspring[i] = toolbox.operand_mutate(
-                                offspring[i], gate_idx=j
-                            )
-
-            if self.params.swap_order_mutation_prob > 0:
-                for i in range(len(offspring)):
-                    for j in range(len(offspring[i])):
-                        if random.random() < self.params.swap_order_mutation_prob:
-                            offspring[i] = toolbox.swap_order_mutate(
-                                offspring[i], gate1_idx=j
-                            )
-
-            with Pool(processes=self.params.cpu_count) as pool:
-                offspring = pool.map(toolbox.evaluate, offspring)
-
-            population = elite + toolbox.select(
-                offspring, k=self.params.population_size - len(elite)
+        random.setstate(random_state)
+        np.random.set_state(numpy_random_state)
+        return offspring
+
+    def _set_population(
+        self, population: List[List[Gate]], fitness_values: List[float]
+    ) -> None:
+        self.evolved_population = population
+        self._ranking = Ranking(fitness_values)
+
+    def _after_generation(
+        self, population: List[List[Gate]], fitness_values: List[float], generation: int
+    ) -> bool:
+        """Log, call callbacks and indicate whether the early abort
+        condition has been reached.
+        """
+        if (
+            self.params.log_average_fitness
+            and generation % self.params.log_average_fitness_at == 0
+        ):
+            average_fitness = mean(fitness_values)
+            print(
+                f"Average population fitness at generation {generation}: {average_fitness}"
             )
-            self.evolved_population = population
 
-            if (
-                self.params.log_average_fitness
-                and generation % self.params.log_average_fitness_at == 0
-            ):
-                average_fitness = mean([ind.fitness.values[0] for ind in population])
+        if (
+            self.params.log_load_imbalance
+            and self.scheduling_report is not None
+            and generation % self.params.log_average_fitness_at == 0
+        ):
+            print(
+                f"Load imbalance at generation {generation}: "
+                f"{self.scheduling_report.load_imbalance:.1%} "
+                f"(efficiency {self.scheduling_report.efficiency:.1%})"
+            )
+
+            for name, stats in self.scheduling_report.engine_stats.items():
                 print(
-                    f"Average population fitness at generation {generation}: {average_fitness}"
+                    f"\t{name} engine: {stats.run_count} runs, "
+                    f"{stats.total_time:.3f}s"
                 )
 
-            # Call callbacks
-            fitness_values = [chromosome.fitness.values[0] for chromosome in population]
-            for callback in self._after_generation_callbacks:
-                callback(self, population, fitness_values, generation)
+        # Call callbacks
+        for callback in self._after_generation_callbacks:
+            callback(self, population, fitness_values, generation)
 
-            # Check early abort condition (fitness value at.)
-            _, fitness_at = self.get_best_chromosomes(
-                n=self.params.fitness_threshold_at + 1
-            )[self.params.fitness_threshold_at]
+        if len(self._async_after_generation_callbacks) > 0:
+            # Taken after the synchronous callbacks, which may have
+            # added gates to the gate set.
+            snapshot = GASnapshot(self, population, fitness_values, generation)
 
-            if fitness_at <= self.params.fitness_threshold:
-                if self.params.log_average_fitness:
-                    print(
-                        "\tFound good enough solution. Skipping remaining generations."
-                    )
+            # Submitted as one call, so that the backlog of the
+            # runner counts generations rather than callbacks.
+            self._callback_runner.submit(
+                self._call_async_after_generation_callbacks, snapshot, generation
+            )
+
+        # Check early abort condition (fitness value at.)
+        fitness_at = self._ranking.fitness_at(self.params.fitness_threshold_at)
+
+        if fitness_at <= self.params.fitness_threshold:
+            if self.params.log_average_fitness:
+                print("\tFound good enough solution. Skipping remaining generations.")
+
+            return True
 
-                break
+        return False
 
+    def _call_async_after_generation_callbacks(
+        self, snapshot: GASnapshot, generation: int
+    ) -> None:
+        for callback in self._async_after_generation_callbacks:
+            callback(
+                snapshot, snapshot.evolved_population, snapshot.fitness_values, generation
+            )
+
+    def _create_checkpoint(
+        self, population: List[List[Gate]], fitness_values: List[float], generation: int
+    ) -> Checkpoint:
+        return Checkpoint(
+            generation=generation,
+            population=population,
+            fitness_values=fitness_values,
+            gate_set=self.gate_set,
+            random_state=random.getstate(),
+            numpy_random_state=self._rng.bit_generator.state,
+        )
+
+    def _complete(self, population: List[List[Gate]], generation: int) -> None:
         fitness_values = [
             chromosome.fitness.values[0] for chromosome in self.evolved_population
         ]
@@ -156,12 +424,17 @@ class GA:
     def get_best_chromosomes(self, n: int = 1) -> List[Tuple[List[Gate], float]]:
         assert self.evolved_population is not None
 
-        self.evolved_population.sort(key=lambda item: item.fitness.values[0])
-        top_n_chromosomes = self.evolved_population[:n]
+        if self._ranking is None:
+            self._ranking = Ranking(
+                [chromosome.fitness.values[0] for chromosome in self.evolved_population]
+            )
 
         result = [
-            (chromosome, chromosome.fitness.values[0])
-            for chromosome in top_n_chromosomes
+            (
+                self.evolved_population[i],
+                self.evolved_population[i].fitness.values[0],
+            )
+            for i in self._ranking.best_indices(n)
         ]
         return result
 
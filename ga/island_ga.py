@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+
+from multiprocessing import Event, Process, Queue
+import numpy as np
+from queue import Empty
+import random
+from typing import Any, Iterator, List, Tuple
+
+from .ga import GA
+from .executors import Executor, PoolExecutor
+from .seeding import ISLAND_STREAM
+from .params import GAParams, IslandParams, default_params, default_island_params
+from gates import Gate, GateSet
+from fitness import Fitness
+from optimizer import Optimizer
+
+RING_TOPOLOGY: str = "ring"
+RANDOM_TOPOLOGY: str = "random"
+
+# Seconds to wait for results of islands before checking whether
+# they are still alive.
+ISLAND_POLL_INTERVAL: float = 1.0
+
+
+class IslandGA(GA):
+    """Island model of the genetic algorithm.
+
+    Each island evolves its own population in a separate process,
+    using the GA params for its population size. The cpu_count of
+    the GA params is split across the evaluation pools of the
+    islands. Every migration_interval generations, an
+    island sends copies of its best chromosomes to another island,
+    where they replace the worst chromosomes. Immigrants are taken
+    in whenever they have arrived, so islands never wait for each
+    other.
+
+    With a seed, each island derives its own random streams from
+    it. Since immigrants are taken in whenever they happen to have
+    arrived, runs with migration are not reproducible nonetheless.
+
+    Generation callbacks are called within the island processes
+    with the island (or a snapshot of it) as GA. Completion callbacks are called once
+    all islands have finished, with the merged population of all
+    islands.
+    """
+
+    island_params: IslandParams
+    island_index: int
+
+    def __init__(
+        self,
+        gate_set: GateSet,
+        fitness: Fitness,
+        optimizer: Optimizer,
+        params: GAParams = default_params,
+        island_params: IslandParams = default_island_params,
+    ) -> None:
+        super().__init__(gate_set, fitness, optimizer, params=params)
+
+        if params.checkpoint_path is not None:
+            raise ValueError(
+                "Checkpoints are only supported by the generational GA, "
+                "checkpoint_path has to be None."
+            )
+
+        assert island_params.topology in [
+            RING_TOPOLOGY,
+            RANDOM_TOPOLOGY,
+        ], f"Unknown migration topology '{island_params.topology}'."
+
+        self.island_params = island_params
+        self.island_index = None
+        self._stop_event = None
+
+    def run(self):
+        self._stopped = False
+
+        # Setting up the toolbox in the main process also creates the
+        # chromosome types needed to receive the islands' populations.
+        # Each island creates its own evaluation pool from the
+        # (not yet started) executor it inherits.
+        self._setup()
+
+        island_count = self.island_params.island_count
+
+        self._stop_event = Event()
+        inboxes = [Queue() for _ in range(island_count)]
+        results = Queue()
+
+        islands = [
+            Process(target=self._run_island, args=(i, inboxes, results))
+            for i in range(island_count)
+        ]
+        for island in islands:
+            island.start()
+
+        populations: List[List[List[Gate]]] = [None] * island_count
+        generations: List[int] = [0] * island_count
+        errors = []
+
+        try:
+            for island_index, result, generation in self._receive_results(
+                islands, results
+            ):
+                if isinstance(result, Exception):
+                    # Let the remaining islands finish early.
+                    self._stop_event.set()
+                    errors.append(result)
+                else:
+                    populations[island_index] = result
+                    generations[island_index] = generation
+        except Exception:
+            self._stop_islands(islands)
+            self._teardown()
+            raise
+
+        for island in islands:
+            island.join()
+
+        self._teardown()
+
+        if len(errors) > 0:
+            raise RuntimeError("Island failed during evolution.") from errors[0]
+
+        population = [
+            chromosome for island_population in populations
+            for chromosome in island_population
+        ]
+        fitness_values = [chromosome.fitness.values[0] for chromosome in population]
+        self._set_population(population, fitness_values)
+
+        self._complete(population, max(generations))
+
+    def resume(self, checkpoint_path: str):
+        raise NotImplementedError(
+            "Checkpoints are only supported by the generational GA."
+        )
+
+    def stop(self) -> None:
+        self._stopped = True
+
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    def _create_executor(self) -> Executor:
+        # Islands evaluate at the same time, so they share the cores.
+        return PoolExecutor(
+            processes=max(1, self.params.cpu_count // self.island_params.island_count)
+        )
+
+    def _receive_results(
+        self, islands: List[Process], results: Queue
+    ) -> Iterator[Tuple[int, Any, int]]:
+        """Yield the result of every island as it arrives. Raise if an
+        island exits without reporting a result (e.g. when it has been
+        killed).
+        """
+        reported = set()
+        # Islands found to have exited at the previous poll. Results
+        # are sent before islands exit, so if an island has still not
+        # reported one poll interval later, it never will.
+        exited = set()
+
+        while len(reported) < len(islands):
+            try:
+                island_index, result, generation = results.get(
+                    timeout=ISLAND_POLL_INTERVAL
+                )
+            except Empty:
+                for island_index in exited:
+                    if island_index not in reported:
+                        raise RuntimeError(
+                            f"Island {island_index} exited with code "
+                            f"{islands[island_index].exitcode} without reporting a result."
+                        )
+
+                exited = set(
+                    [
+                        island_index
+                        for island_index, island in enumerate(islands)
+                        if island.exitcode is not None
+                    ]
+                )
+                continue
+
+            reported.add(island_index)
+            yield island_index, result, generation
+
+    def _stop_islands(self, islands: List[Process]) -> None:
+        self._stop_event.set()
+
+        for island in islands:
+            island.join(timeout=ISLAND_POLL_INTERVAL)
+
+            if island.is_alive():
+                island.terminate()
+                island.join()
+
+    def _run_island(self, island_index: int, inboxes: List[Queue], results: Queue):
+        # Immigrants that are never received must not keep the
+        # island process from exiting.
+        for inbox in inboxes:
+            inbox.cancel_join_thread()
+
+        self.island_index = island_index
+
+        # Forked islands inherit the random state of the main
+        # process and would otherwise evolve identical populations.
+        if self.params.seed is None:
+            random.seed()
+
+        self._seed_key = (ISLAND_STREAM, island_index)
+        self._seed()
+
+        generation = 0
+
+        try:
+            population = self.toolbox.population(n=self.params.population_size)
+
+            for generation in range(1, self.params.generations + 1):
+                if self._stopped or self._stop_event.is_set():
+                    break
+
+                population, fitness_values = self._evolve(population, generation)
+
+                if self._after_generation(population, fitness_values, generation):
+                    self._stop_event.set()
+                    break
+
+                if generation % self.island_params.migration_interval == 0:
+                    self._emigrate(population, inboxes)
+
+                population = self._immigrate(population, inboxes[island_index])
+
+        except Exception as e:
+            results.put((island_index, e, generation))
+            return
+        finally:
+            self._teardown()
+
+        results.put((island_index, population, generation))
+
+    def _emigrate(self, population: List[List[Gate]], inboxes: List[Queue]) -> None:
+        island_count = len(inboxes)
+        if island_count < 2:
+            return
+
+        if self.island_params.topology == RING_TOPOLOGY:
+            destination = (self.island_index + 1) % island_count
+        else:
+            destination = self._rng.choice(
+                [i for i in range(island_count) if i != self.island_index]
+            )
+
+        emigrants = [
+            population[i]
+            for i in self._ranking.best_indices(self.island_params.migration_count)
+        ]
+        inboxes[destination].put(emigrants)
+
+    def _immigrate(self, population: List[List[Gate]], inbox: Queue) -> List[List[Gate]]:
+        immigrants = []
+        while True:
+            try:
+                immigrants.extend(inbox.get_nowait())
+            except Empty:
+                break
+
+        immigrant_count = min(len(immigrants), len(population))
+        if immigrant_count == 0:
+            return population
+
+        fitness_values = np.array(
+            [chromosome.fitness.values[0] for chromosome in population], dtype=float
+        )
+        # Invalid fitness values are replaced first.
+        fitness_values = np.where(np.isnan(fitness_values), np.inf, fitness_values)
+        worst_indices = np.argpartition(fitness_values, -immigrant_count)[
+            -immigrant_count:
+        ]
+
+        population = list(population)
+        for i, immigrant in zip(worst_indices, immigrants[:immigrant_count]):
+            population[i] = immigrant
+
+        self._set_population(
+            population, [chromosome.fitness.values[0] for chromosome in population]
+        )
+        return population
@@ -18,7 +18,25 @@ class GAParams:
     fitness_threshold_at: int = 0
     log_average_fitness: bool = True
     log_average_fitness_at: int = 5
+    # Log how unevenly the evaluation work of a generation was
+    # spread across workers and the time spent per simulation engine.
+    log_load_imbalance: bool = False
     elitism_percentage: float = 0
+    # Either "tournament" or "sus" (stochastic universal sampling).
+    selection_method: str = "tournament"
+    tournament_size: int = 2
+    # If a checkpoint path is specified, the state of the GA is
+    # written to it every checkpoint_interval generations and can
+    # be restored through GA.resume.
+    checkpoint_path: str = None
+    checkpoint_interval: int = 10
+    # Seeds the random streams of the run. Runs with the same seed
+    # produce the same results, regardless of the executor and its
+    # number of workers.
+    seed: int = None
+    # Number of generations by which async-safe generation callbacks
+    # may fall behind before the GA waits for them.
+    callback_backlog: int = 2
     cpu_count: int = field(default_factory=lambda: cpu_count() - 1)
 
     @property
@@ -27,3 +45,32 @@ class GAParams:
 
 
 default_params = GAParams()
+
+
+@dataclass
+class IslandParams:
+    island_count: int = 4
+    # Islands exchange their best chromosomes every
+    # migration_interval generations.
+    migration_interval: int = 10
+    migration_count: int = 5
+    # Either "ring" (each island sends to its successor) or
+    # "random" (each island sends to a randomly chosen island).
+    topology: str = "ring"
+
+
+default_island_params = IslandParams()
+
+
+@dataclass
+class SteadyStateParams:
+    # Number of chromosomes that are evaluated at the same time.
+    # Defaults to the cpu_count of the GA params.
+    concurrency: int = None
+    # An evaluated offspring replaces the worst of
+    # replacement_tournament_size randomly drawn chromosomes
+    # of the population, unless it is worse than that chromosome.
+    replacement_tournament_size: int = 2
+
+
+default_steady_state_params = SteadyStateParams()
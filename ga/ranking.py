@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+import numpy as np
+from typing import List
+
+
+class Ranking:
+    """Ranking of a population based on its fitness values, where
+    lower fitness values are better.
+
+    The ranking is built once per generation. Only the requested
+    top of the ranking is ordered (through a partial partition of
+    the fitness values) and cached, so that repeated queries for
+    the best chromosomes, the fitness at a certain rank or the
+    elite do not require sorting the whole population again.
+    Ties are resolved in favor of the individual that comes first
+    in the population, which matches a stable sort.
+    """
+
+    fitness_values: np.ndarray
+
+    _ordered_indices: np.ndarray
+
+    def __init__(self, fitness_values: List[float]) -> None:
+        self.fitness_values = np.asarray(fitness_values, dtype=float)
+        self._ordered_indices = np.empty(0, dtype=int)
+
+    def __len__(self) -> int:
+        return len(self.fitness_values)
+
+    def best_indices(self, n: int = 1) -> np.ndarray:
+        """Return the population indices of the n best individuals
+        in ascending order of their fitness values.
+        """
+        n = max(min(n, len(self)), 0)
+
+        if n > len(self._ordered_indices):
+            self._ordered_indices = self._order_top(n)
+
+        return self._ordered_indices[:n]
+
+    def fitness_at(self, rank: int) -> float:
+        """Return the fitness value of the individual at the
+        specified rank (0 being the best individual).
+        """
+        assert rank < len(self), f"Rank {rank} exceeds population size {len(self)}."
+
+        index = self.best_indices(rank + 1)[rank]
+        return self.fitness_values[index].item()
+
+    def _order_top(self, n: int) -> np.ndarray:
+        if n == len(self):
+            return np.argsort(self.fitness_values, kind="stable")
+
+        kth_value = np.partition(self.fitness_values, n - 1)[n - 1]
+
+        if np.isnan(kth_value):
+            return np.argsort(self.fitness_values, kind="stable")[:n]
+
+        better_indices = np.flatnonzero(self.fitness_values < kth_value)
+        tied_indices = np.flatnonzero(self.fitness_values == kth_value)[
+            : n - len(better_indices)
+        ]
+
+        candidates = np.concatenate([better_indices, tied_indices])
+        order = np.argsort(self.fitness_values[candidates], kind="stable")
+        return candidates[order]
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+from dataclasses import dataclass, field
+from functools import partial
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from .executors import Executor
+from optimizer.utils import EngineStats, collect_engine_stats
+
+# Evaluations are dispatched longest-first in chunks whose
+# estimated cost shrinks with the remaining work (guided
+# self-scheduling), so that expensive chromosomes start early
+# and the many cheap ones at the end fill up idle workers.
+
+# Each chunk holds at most 1 / (CHUNK_FACTOR * worker_count) of the
+# remaining estimated cost, unless a single item exceeds it.
+CHUNK_FACTOR: int = 2
+
+
+@dataclass
+class SchedulingReport:
+    task_count: int
+    chunk_count: int
+    worker_count: int
+    # Wall-clock time of the whole evaluation in seconds.
+    makespan: float
+    # Time each worker spent evaluating, in seconds.
+    busy_times: List[float]
+    # Runs and simulation time of the engines chosen for the
+    # evaluated chromosomes, summed over all workers.
+    engine_stats: Dict[str, EngineStats] = field(default_factory=dict)
+
+    @property
+    def total_work(self) -> float:
+        return sum(self.busy_times)
+
+    @property
+    def load_imbalance(self) -> float:
+        """Relative excess of the busiest worker over a perfectly
+        balanced distribution of the total work (0 if balanced).
+        """
+        if self.total_work == 0:
+            return 0.0
+
+        mean_busy_time = self.total_work / self.worker_count
+        return max(self.busy_times) / mean_busy_time - 1
+
+    @property
+    def efficiency(self) -> float:
+        """Ratio of the ideal makespan (total work divided by the
+        number of workers) to the observed makespan.
+        """
+        if self.makespan == 0:
+            return 1.0
+
+        return self.total_work / (self.worker_count * self.makespan)
+
+
+def schedule_chunks(costs: List[float], worker_count: int) -> List[List[int]]:
+    """Split item indices into chunks in descending order of their
+    estimated costs.
+    """
+    order = sorted(range(len(costs)), key=lambda i: costs[i], reverse=True)
+    remaining_cost = sum(costs)
+
+    chunks = []
+    chunk = []
+    chunk_cost = 0
+    target_cost = remaining_cost / (CHUNK_FACTOR * max(worker_count, 1))
+
+    for i in order:
+        if len(chunk) > 0 and chunk_cost + costs[i] > target_cost:
+            chunks.append(chunk)
+            remaining_cost -= chunk_cost
+
+            chunk = []
+            chunk_cost = 0
+            target_cost = remaining_cost / (CHUNK_FACTOR * max(worker_count, 1))
+
+        chunk.append(i)
+        chunk_cost += costs[i]
+
+    if len(chunk) > 0:
+        chunks.append(chunk)
+
+    return chunks
+
+
+def _run_chunk(
+    function: Callable, chunk: List[Tuple[int, Any]]
+) -> Tuple[
+    Tuple[str, int, int], float, List[Tuple[int, Any]], Dict[str, EngineStats]
+]:
+    # Discard runs of the worker outside of chunks.
+    collect_engine_stats()
+
+    started_at = time.perf_counter()
+    results = [(index, function(item)) for index, item in chunk]
+    duration = time.perf_counter() - started_at
+
+    worker_id = (socket.gethostname(), os.getpid(), threading.get_ident())
+    return worker_id, duration, results, collect_engine_stats()
+
+
+def map_scheduled(
+    executor: Executor,
+    function: Callable,
+    items: List[Any],
+    costs: List[float],
+) -> Tuple[List[Any], SchedulingReport]:
+    """Apply function to every item through the executor, streaming
+    chunks in descending order of the estimated costs. Return the
+    results in the order of the items along with a report of how
+    evenly the work was spread across workers.
+    """
+    worker_count = executor.worker_count
+    chunks = schedule_chunks(costs, worker_count)
+
+    started_at = time.perf_counter()
+
+    results = [None] * len(items)
+    busy_times: Dict[Tuple[str, int, int], float] = {}
+    engine_stats: Dict[str, EngineStats] = {}
+
+    for worker_id, duration, chunk_results, chunk_engine_stats in executor.imap_unordered(
+        partial(_run_chunk, function),
+        [[(i, items[i]) for i in chunk] for chunk in chunks],
+    ):
+        busy_times[worker_id] = busy_times.get(worker_id, 0) + duration
+
+        for name, stats in chunk_engine_stats.items():
+            total_stats = engine_stats.setdefault(name, EngineStats())
+            total_stats.run_count += stats.run_count
+            total_stats.total_time += stats.total_time
+
+        for index, result in chunk_results:
+            results[index] = result
+
+    makespan = time.perf_counter() - started_at
+
+    # Workers that did not receive any chunk have been idle.
+    worker_count = max(worker_count, len(busy_times))
+    busy_times = list(busy_times.values())
+    busy_times += [0.0] * (worker_count - len(busy_times))
+
+    report = SchedulingReport(
+        task_count=len(items),
+        chunk_count=len(chunks),
+        worker_count=worker_count,
+        makespan=makespan,
+        busy_times=busy_times,
+        engine_stats=engine_stats,
+    )
+    return results, report
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import random
+from typing import Any, Callable, Tuple
+
+# Independent random streams are derived from the seed of a run
+# through the spawn keys of numpy seed sequences. Streams of the
+# main process are keyed by their purpose, streams of evaluation
+# tasks additionally by generation and position in the offspring,
+# so that they do not depend on which worker runs a task or in
+# which order tasks are run.
+
+RANDOM_STREAM: int = 0
+GENERATOR_STREAM: int = 1
+TASK_STREAM: int = 2
+ISLAND_STREAM: int = 3
+
+
+def create_seed_sequence(seed: int, *key: int) -> np.random.SeedSequence:
+    return np.random.SeedSequence(seed, spawn_key=key)
+
+
+def seed_random(seed_sequence: np.random.SeedSequence) -> None:
+    """Seed the global random state of the random module (used by
+    gates and genetic operators) and of numpy.
+    """
+    random.seed(int.from_bytes(seed_sequence.generate_state(4).tobytes(), "little"))
+    np.random.seed(seed_sequence.generate_state(4))
+
+
+def run_seeded(
+    function: Callable, task: Tuple[np.random.SeedSequence, Any]
+) -> Any:
+    """Apply function to the item of a task after seeding the random
+    state of the (worker) process with the seed sequence of the task.
+
+    The global random states of random and numpy are reseeded by
+    every task, which is not thread-safe: with a ThreadExecutor,
+    functions that draw random numbers during evaluation would
+    draw from the streams of concurrently running tasks.
+    """
+    seed_sequence, item = task
+
+    seed_random(seed_sequence)
+    return function(item)
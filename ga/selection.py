@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+import numpy as np
+from typing import List, Union
+
+from .ranking import Ranking
+
+# Selection functions operate on contiguous arrays of fitness
+# values (lower is better) and return the indices of the selected
+# individuals, so that the genomes can be gathered in one step.
+
+TOURNAMENT_SELECTION: str = "tournament"
+STOCHASTIC_UNIVERSAL_SAMPLING: str = "sus"
+
+
+def _as_fitness_array(fitness_values: Union[List[float], np.ndarray]) -> np.ndarray:
+    fitness_values = np.asarray(fitness_values, dtype=float)
+
+    # Treat invalid fitness values as the worst possible ones.
+    return np.where(np.isnan(fitness_values), np.inf, fitness_values)
+
+
+def tournament_selection(
+    fitness_values: Union[List[float], np.ndarray],
+    k: int,
+    tournament_size: int = 2,
+    rng: np.random.Generator = None,
+) -> np.ndarray:
+    """Run k tournaments at once. Contestants are drawn with
+    replacement, the contestant with the lowest fitness value
+    wins its tournament.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    fitness_values = _as_fitness_array(fitness_values)
+
+    contestants = rng.integers(0, len(fitness_values), size=(k, tournament_size))
+    winners = np.argmin(fitness_values[contestants], axis=1)
+
+    return contestants[np.arange(k), winners]
+
+
+def elite_selection(fitness_values: Union[List[float], np.ndarray], k: int) -> np.ndarray:
+    """Select the k individuals with the lowest fitness values."""
+    return Ranking(_as_fitness_array(fitness_values)).best_indices(k)
+
+
+def stochastic_universal_sampling(
+    fitness_values: Union[List[float], np.ndarray],
+    k: int,
+    rng: np.random.Generator = None,
+) -> np.ndarray:
+    """Select k individuals with probabilities proportional to how
+    much better they are than the worst individual, using k evenly
+    spaced pointers with a single random offset.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    if k == 0:
+        return np.empty(0, dtype=int)
+
+    fitness_values = _as_fitness_array(fitness_values)
+
+    finite = np.isfinite(fitness_values)
+    if not finite.any():
+        weights = np.ones(len(fitness_values))
+    else:
+        worst = fitness_values[finite].max()
+        weights = np.where(finite, worst - fitness_values, 0)
+
+    # Fall back to uniform sampling if all individuals are equally good.
+    if weights.sum() <= 0:
+        weights = np.ones(len(fitness_values))
+
+    cumulative_weights = np.cumsum(weights)
+    step = cumulative_weights[-1] / k
+    pointers = rng.uniform(0, step) + step * np.arange(k)
+
+    indices = np.searchsorted(cumulative_weights, pointers, side="right")
+    return np.minimum(indices, len(fitness_values) - 1)
+
+
+def select(
+    fitness_values: Union[List[float], np.ndarray],
+    k: int,
+    method: str = TOURNAMENT_SELECTION,
+    tournament_size: int = 2,
+    rng: np.random.Generator = None,
+) -> np.ndarray:
+    if method == TOURNAMENT_SELECTION:
+        return tournament_selection(
+            fitness_values, k, tournament_size=tournament_size, rng=rng
+        )
+    elif method == STOCHASTIC_UNIVERSAL_SAMPLING:
+        return stochastic_universal_sampling(fitness_values, k, rng=rng)
+    else:
+        raise ValueError(f"Unknown selection method '{method}'.")
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+import numpy as np
+from queue import Queue
+from typing import Any, List
+
+from .executors import Executor
+from .ga import GA
+from .params import (
+    GAParams,
+    SteadyStateParams,
+    default_params,
+    default_steady_state_params,
+)
+from .selection import select
+from gates import Gate, GateSet
+from fitness import Fitness
+from optimizer import Optimizer
+
+
+class SteadyStateGA(GA):
+    """Asynchronous steady-state variant of the genetic algorithm.
+
+    Instead of waiting for a whole generation to be evaluated,
+    a new offspring is submitted to the executor as soon as the
+    evaluation of another one has finished, so that workers do
+    not idle while slow (e.g. numerically optimized) chromosomes
+    are being evaluated. Each evaluated offspring is inserted into
+    the population through a replacement tournament.
+
+    Every population_size evaluations count as one generation:
+    generation callbacks are called, the early abort condition is
+    checked and params.generations limits the number of them.
+
+    Since offspring are inserted in the order in which their
+    evaluations finish, runs are not reproducible, even with a seed.
+    """
+
+    steady_state_params: SteadyStateParams
+
+    def __init__(
+        self,
+        gate_set: GateSet,
+        fitness: Fitness,
+        optimizer: Optimizer,
+        params: GAParams = default_params,
+        steady_state_params: SteadyStateParams = default_steady_state_params,
+        executor: Executor = None,
+    ) -> None:
+        super().__init__(gate_set, fitness, optimizer, params=params, executor=executor)
+
+        if params.checkpoint_path is not None:
+            raise ValueError(
+                "Checkpoints are only supported by the generational GA, "
+                "checkpoint_path has to be None."
+            )
+
+        self.steady_state_params = steady_state_params
+
+        self._results = None
+        self._pending_count = 0
+        self._created_count = 0
+        self._offspring = []
+
+    def run(self):
+        self._stopped = False
+        self._setup()
+
+        self._results = Queue()
+        self._pending_count = 0
+        self._created_count = 0
+        self._offspring = []
+
+        concurrency = self.steady_state_params.concurrency
+        if concurrency is None:
+            concurrency = self.params.cpu_count
+
+        population_size = self.params.population_size
+        population: List[List[Gate]] = []
+        fitness_values = np.empty(population_size, dtype=float)
+
+        evaluation_count = 0
+        generation = 0
+
+        try:
+            for _ in range(max(concurrency, 1)):
+                self._submit(self._next_chromosome(population, fitness_values))
+
+            while self._pending_count > 0:
+                chromosome = self._receive()
+                evaluation_count += 1
+
+                if len(population) < population_size:
+                    fitness_values[len(population)] = chromosome.fitness.values[0]
+                    population.append(chromosome)
+                else:
+                    self._replace(population, fitness_values, chromosome)
+
+                if evaluation_count % population_size == 0:
+                    generation = evaluation_count // population_size
+
+                    snapshot = list(population)
+                    snapshot_fitness_values = fitness_values.tolist()
+                    self._set_population(snapshot, snapshot_fitness_values)
+
+                    if self._after_generation(
+                        snapshot, snapshot_fitness_values, generation
+                    ):
+                        break
+
+                    if self._stopped or generation >= self.params.generations:
+                        break
+
+                self._submit(self._next_chromosome(population, fitness_values))
+        finally:
+            self._drain()
+            self._teardown()
+
+        population = list(population)
+        self._set_population(population, fitness_values[: len(population)].tolist())
+
+        self._complete(population, generation)
+
+    def resume(self, checkpoint_path: str):
+        raise NotImplementedError(
+            "Checkpoints are only supported by the generational GA."
+        )
+
+    def _next_chromosome(
+        self, population: List[List[Gate]], fitness_values: np.ndarray
+    ) -> List[Gate]:
+        # The initial population is created randomly, breeding
+        # starts once all of its chromosomes have been submitted.
+        if self._created_count < self.params.population_size or len(population) == 0:
+            self._created_count += 1
+            return self.toolbox.individual()
+
+        if len(self._offspring) == 0:
+            self._offspring = self._breed(population, fitness_values[: len(population)])
+
+        return self._offspring.pop()
+
+    def _breed(
+        self, population: List[List[Gate]], fitness_values: np.ndarray
+    ) -> List[List[Gate]]:
+        parent_indices = select(
+            fitness_values,
+            k=2,
+            method=self.params.selection_method,
+            tournament_size=self.params.tournament_size,
+            rng=self._rng,
+        )
+        offspring = [self.toolbox.clone(population[i]) for i in parent_indices]
+        return self._vary(offspring)
+
+    def _replace(
+        self,
+        population: List[List[Gate]],
+        fitness_values: np.ndarray,
+        chromosome: List[Gate],
+    ) -> None:
+        """Replace the worst contestant of a tournament among the
+        population, unless the chromosome is worse than it.
+        """
+        # Invalid fitness values are treated as the worst ones.
+        comparable_values = np.where(np.isnan(fitness_values), np.inf, fitness_values)
+
+        contestants = self._rng.integers(
+            0,
+            len(population),
+            size=self.steady_state_params.replacement_tournament_size,
+        )
+        loser = contestants[np.argmax(comparable_values[contestants])]
+
+        fitness_value = chromosome.fitness.values[0]
+        if np.isnan(fitness_value) or fitness_value > comparable_values[loser]:
+            return
+
+        population[loser] = chromosome
+        fitness_values[loser] = fitness_value
+
+    def _submit(self, chromosome: List[Gate]) -> None:
+        self._pending_count += 1
+        self._executor.submit(
+            self.toolbox.evaluate,
+            chromosome,
+            callback=self._on_result,
+            error_callback=self._on_error,
+        )
+
+    def _on_result(self, chromosome: List[Gate]) -> None:
+        self._results.put((True, chromosome))
+
+    def _on_error(self, error: BaseException) -> None:
+        self._results.put((False, error))
+
+    def _receive(self) -> Any:
+        succeeded, result = self._results.get()
+        self._pending_count -= 1
+
+        if not succeeded:
+            raise result
+
+        return result
+
+    def _drain(self) -> None:
+        # Wait for evaluations that are still running, so that
+        # they do not occupy a (user-provided) executor after the
+        # run has finished.
+        while self._pending_count > 0:
+            try:
+                self._receive()
+            except Exception:
+                pass
@@ -53,11 +53,21 @@ def evaluate_individual(
     return chromosome
 
 
+def create_types() -> None:
+    # Recreating the types would leave existing chromosomes (e.g.
+    # restored from a checkpoint) with types that can no longer
+    # be pickled.
+    if hasattr(creator, "Individual"):
+        return
+
+    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
+    creator.create("Individual", list, fitness=creator.FitnessMin)
+
+
 def init_toolbox(
     gate_set: GateSet, chromosome_length: int, fitness: Fitness, optimizer: Optimizer
 ) -> Any:
-    creator.create("FitnessMin", base.Fitness, weights=(-1.0,))
-    creator.create("Individual", list, fitness=creator.FitnessMin)
+    create_types()
 
     toolbox = base.Toolbox()
     toolbox.register(
@@ -75,6 +85,4 @@ def init_toolbox(
     toolbox.register("swap_gate_mutate", swap_gate_mutation, gate_set=gate_set)
     toolbox.register("swap_order_mutate", swap_order_mutation)
     toolbox.register("operand_mutate", operand_mutation)
-    toolbox.register("select", tools.selTournament, tournsize=2)
-    toolbox.register("select_best", tools.selBest)
     return toolbox
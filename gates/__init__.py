@@ -30,3 +30,4 @@ from .z_layer import ZLayer
 from .combined_gate import CombinedGate, CombinedGateConstructor
 from .swap_layer import SwapLayer
 from .ch import CH
+from .compiled_chromosome import CompiledChromosome, compile_chromosome
@@ -9,6 +9,7 @@ from .gate import Gate
 
 class CCX(Gate):
     name: str = "ccx"
+    is_permutation: bool = True
 
     controll1: int
     controll2: int
@@ -9,6 +9,7 @@ from .gate import Gate
 
 class CCZ(Gate):
     name: str = "ccz"
+    is_diagonal: bool = True
 
     controll1: int
     controll2: int
@@ -85,6 +85,30 @@ class CombinedGate(OptimizableGate, MultiCaseGate):
 
         return False
 
+    @property
+    def is_diagonal(self) -> bool:
+        for gate in self.gates:
+            if not gate.is_diagonal:
+                return False
+
+        return True
+
+    @property
+    def is_permutation(self) -> bool:
+        for gate in self.gates:
+            if not gate.is_permutation:
+                return False
+
+        return True
+
+    @property
+    def is_clifford(self) -> bool:
+        for gate in self.gates:
+            if not gate.is_clifford:
+                return False
+
+        return True
+
     # Optimizable gate functions
     @property
     def params(self) -> List[float]:
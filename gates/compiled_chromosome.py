@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+from collections import Counter
+from typing import Any, Counter as CounterType, List
+
+from .gate import Gate
+from .combined_gate import CombinedGate
+
+
+class CompiledChromosome(list):
+    """Chromosome prepared for simulation.
+
+    Behaves like the original list of gates, so that fitness
+    functions and validity checks see the chromosome as it was
+    evolved. In addition, it holds a compacted list of
+    instructions, in which combined gates have been flattened
+    and gates without effect (such as the identity) have been
+    removed, as well as gate counts that would otherwise have
+    to be recomputed from the chromosome.
+
+    The instructions reference the gates of the original
+    chromosome. Parameter updates through set_params therefore
+    remain visible, so that the compiled chromosome can be
+    reused across all cases and optimizer iterations as long as
+    the structure of the chromosome does not change.
+    """
+
+    instructions: List[Gate]
+    gate_count: int
+    gate_type_counts: CounterType[Any]
+
+    def __init__(self, chromosome: List[Gate]) -> None:
+        super().__init__(chromosome)
+
+        self.instructions = []
+        self.gate_count = 0
+        self.gate_type_counts = Counter()
+
+        for gate in chromosome:
+            self.gate_count += gate.gate_count
+            self.gate_type_counts[type(gate)] += 1
+
+            if type(gate) == CombinedGate:
+                for GateType in gate.GateTypes:
+                    self.gate_type_counts[GateType] += 1
+
+                self.instructions.extend(
+                    [sub_gate for sub_gate in gate.gates if not is_noop(sub_gate)]
+                )
+            elif not is_noop(gate):
+                self.instructions.append(gate)
+
+
+def is_noop(gate: Gate) -> bool:
+    # Gates that do not consist of any base gate (e.g. the
+    # identity) leave the circuit untouched.
+    return gate.gate_count == 0
+
+
+def compile_chromosome(chromosome: List[Gate]) -> CompiledChromosome:
+    if type(chromosome) == CompiledChromosome:
+        return chromosome
+
+    return CompiledChromosome(chromosome)
@@ -9,6 +9,8 @@ from .gate import Gate
 
 class CX(Gate):
     name: str = "cx"
+    is_permutation: bool = True
+    is_clifford: bool = True
 
     controll: int
     target: int
@@ -9,6 +9,7 @@ from .gate import Gate
 
 class CY(Gate):
     name: str = "cy"
+    is_clifford: bool = True
 
     controll: int
     target: int
@@ -9,6 +9,8 @@ from .gate import Gate
 
 class CZ(Gate):
     name: str = "cz"
+    is_diagonal: bool = True
+    is_clifford: bool = True
 
     controll: int
     target: int
@@ -16,6 +16,23 @@ class Gate(ABC):
     is_optimizable: bool = False
     is_oracle: bool = False
     is_multicase: bool = False
+    # Whether the gate is diagonal in the computational basis,
+    # i.e. only changes the phases of basis states.
+    is_diagonal: bool = False
+    # Whether the gate only permutes the basis states.
+    is_permutation: bool = False
+    # Whether the gate is a Clifford gate, i.e. maps Pauli
+    # operators onto Pauli operators, so that it can be simulated
+    # on a stabilizer tableau.
+    is_clifford: bool = False
+    # Whether the gate provides initial_states: the states it
+    # prepares from the all-zero state, for each case. Simulations
+    # of chromosomes that start with such a gate can start from
+    # those states instead of applying the gate.
+    prepares_initial_state: bool = False
+    # Whether the gate provides an operator (see gates.operators)
+    # that simulations can apply instead of the gate's base gates.
+    has_operator: bool = False
 
     # Can be overwritten if a gate combines multiple
     # base gates.
@@ -1,14 +1,26 @@
 #!/usr/bin/env python3
 
 from random import choice
-from typing import Type, List
+from typing import Any, Dict, Hashable, Type, List, Tuple
 
 from .gate import Gate
-from .oracle import Oracle
+from .oracle import Oracle, OracleConstructor
+from .combined_gate import CombinedGate, CombinedGateConstructor
+from .input import InputEncodingConstructor
 from .utils import construct_gate_type_name
 
 
 class GateSet:
+    """Set of gate types (or constructors) from which chromosomes
+    are built.
+
+    Every gate type name is interned as a stable integer id in the
+    order in which it is encountered, so that chromosome signatures
+    and ngrams can be represented as tuples of small ints instead
+    of joined name strings (see ngram_ids, chromosome_signature).
+    Ids never change once assigned, also when gate types are added.
+    """
+
     gates: List[Type[Gate]] = []
     gate_names: List[str] = []
 
@@ -17,6 +29,16 @@ class GateSet:
         self.gate_names = [construct_gate_type_name(gate) for gate in gates]
         self._qubit_num = qubit_num
 
+        self._gate_type_ids: Dict[str, int] = {}
+        # Ids and ngram ids by gate class, constructor or tuple of
+        # combined gate types, to avoid building names repeatedly.
+        self._id_cache: Dict[Hashable, int] = {}
+        self._ngram_id_cache: Dict[Hashable, Tuple[int, ...]] = {}
+
+        # Ids of the gate types in the gate set, as opposed to gate
+        # types that only occur within combined gates.
+        self._member_ids = set([self._intern(gate_name) for gate_name in self.gate_names])
+
     def random_gate(self) -> Gate:
         """Selects a gate type at random and initializes it."""
 
@@ -26,8 +48,7 @@ class GateSet:
         return gate
 
     def contains(self, gate: Type[Gate]) -> bool:
-        gate_name = construct_gate_type_name(gate)
-        return gate_name in self.gate_names
+        return self.gate_type_id(gate) in self._member_ids
 
     def append(self, gate: Type[Gate]) -> None:
         if self.contains(gate):
@@ -35,6 +56,89 @@ class GateSet:
 
         self.gates.append(gate)
         self.gate_names.append(construct_gate_type_name(gate))
+        self._member_ids.add(self.gate_type_id(gate))
+
+    def copy(self) -> "GateSet":
+        """Return a copy that is not affected by gate types being
+        added to this gate set, with the same gate type ids.
+        """
+        gate_set = GateSet.__new__(GateSet)
+        gate_set.gates = list(self.gates)
+        gate_set.gate_names = list(self.gate_names)
+        gate_set._qubit_num = self._qubit_num
+        gate_set._gate_type_ids = dict(self._gate_type_ids)
+        gate_set._id_cache = dict(self._id_cache)
+        gate_set._ngram_id_cache = dict(self._ngram_id_cache)
+        gate_set._member_ids = set(self._member_ids)
+
+        return gate_set
+
+    def gate_type_id(self, gate: Any) -> int:
+        """Return the id of the parameter-free name of a gate, gate
+        type or constructor (see construct_gate_type_name).
+        """
+        key = self._cache_key(gate)
+
+        if key not in self._id_cache:
+            self._id_cache[key] = self._intern(construct_gate_type_name(gate))
+
+        return self._id_cache[key]
+
+    def ngram_ids(self, gate: Any) -> Tuple[int, ...]:
+        """Return the ids of the gate types a gate consists of. Combined
+        gates are flattened into their gate types, so that the ngram
+        ids of a list of gates equal the ids of the parts of its
+        construct_ngram_name.
+        """
+        key = self._cache_key(gate)
+
+        if key not in self._ngram_id_cache:
+            if type(gate) in [CombinedGate, CombinedGateConstructor]:
+                self._ngram_id_cache[key] = tuple(
+                    [self._intern(self._base_name(GateType)) for GateType in gate.GateTypes]
+                )
+            else:
+                self._ngram_id_cache[key] = (self.gate_type_id(gate),)
+
+        return self._ngram_id_cache[key]
+
+    def chromosome_signature(self, chromosome: List[Gate]) -> Tuple[int, ...]:
+        """Return the ngram ids of all gates of a chromosome. Qubit ids
+        and parameter values are not taken into account.
+        """
+        signature = []
+        for gate in chromosome:
+            signature.extend(self.ngram_ids(gate))
+
+        return tuple(signature)
+
+    def _intern(self, gate_name: str) -> int:
+        if gate_name not in self._gate_type_ids:
+            self._gate_type_ids[gate_name] = len(self._gate_type_ids)
+
+        return self._gate_type_ids[gate_name]
+
+    def _cache_key(self, gate: Any) -> Hashable:
+        gate_type = type(gate)
+
+        if gate_type in [CombinedGate, CombinedGateConstructor]:
+            return (CombinedGate, tuple(gate.GateTypes))
+        elif gate_type in [OracleConstructor, InputEncodingConstructor] or isinstance(
+            gate, type
+        ):
+            # Gate classes and constructors of the gate set.
+            return gate
+        else:
+            # Gate instances in chromosomes.
+            return gate_type
+
+    def _base_name(self, GateType: Any) -> str:
+        if GateType == Oracle or type(GateType) == OracleConstructor:
+            return "oracle"
+        elif type(GateType) == InputEncodingConstructor:
+            return GateType.EncodingType.name
+        else:
+            return GateType.name
 
     def __repr__(self) -> str:
         representation = f"[{','.join([str(gate) for gate in self.gates])}]"
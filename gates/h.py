@@ -9,6 +9,7 @@ from .gate import Gate
 
 class H(Gate):
     name: str = "h"
+    is_clifford: bool = True
 
     target: int
 
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import numpy as np
 from quasim import Circuit
 from quasim.gates import X
 from typing import List
@@ -9,6 +10,7 @@ from .input import InputEncoding, InputEncodingConstructor
 
 class BinaryEncoding(InputEncoding):
     name: str = "x_input"
+    is_clifford: bool = True
 
     _circuits: List[Circuit] = None
     _targets: List[int] = None
@@ -31,5 +33,29 @@ class BinaryEncoding(InputEncoding):
 
         return circuits
 
+    def build_initial_states(
+        self, circuits: List[Circuit], qubit_num: int
+    ) -> np.ndarray:
+        # Each case is the basis state of its flip mask.
+        initial_states = np.zeros((len(circuits), 2**qubit_num), dtype=np.complex128)
+        initial_states[np.arange(len(circuits)), self.flip_masks] = 1
+
+        return initial_states
+
+    @property
+    def flip_masks(self) -> np.ndarray:
+        """The bits of the basis state indices flipped by each case
+        circuit (qubit 0 being the most significant bit).
+        """
+        qubit_num = len(self._targets)
+
+        return np.array(
+            [
+                sum([1 << (qubit_num - 1 - gate.target_qubit) for gate in circuit.gates])
+                for circuit in self._circuits
+            ],
+            dtype=np.int64,
+        )
+
     def __repr__(self) -> str:
         return f"{self.name}({','.join(['target' + str((i + 1)) + '=' + str(target) for i, target in enumerate(self._targets)])})"
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
 from abc import ABC, abstractmethod, abstractclassmethod
-from quasim import Circuit
-from typing import Any, List, Type
+import numpy as np
+from quasim import Circuit, QuaSim
+from typing import Any, Dict, List, Tuple, Type
 
 from gates.multicase_gate import MultiCaseGate
 
@@ -10,13 +11,32 @@ from gates.multicase_gate import MultiCaseGate
 class InputEncoding(MultiCaseGate, ABC):
     name: str = "input"
     is_input: bool = True
+    prepares_initial_state: bool = True
 
     _circuits: List[Circuit] = None
+    _initial_states: np.ndarray = None
     _targets: List[int] = None
 
-    def __init__(self, qubit_num: int, input_values: List[List[int]]) -> None:
+    _shared_attributes: List[str] = ["_circuits", "_initial_states"]
+
+    def __init__(
+        self,
+        qubit_num: int,
+        input_values: List[List[int]],
+        circuits: List[Circuit] = None,
+        initial_states: np.ndarray = None,
+    ) -> None:
+        """Case circuits and initial states can be passed to share
+        them between encodings of the same input values (see
+        InputEncodingConstructor).
+        """
         self._targets = list(range(qubit_num))
-        self._circuits = self.build_circuits(qubit_num, input_values)
+
+        if circuits is None:
+            circuits = self.build_circuits(qubit_num, input_values)
+
+        self._circuits = circuits
+        self._initial_states = initial_states
 
     @abstractmethod
     def build_circuits(self, qubit_num: int, input_values: List[List[int]]) -> None: ...
@@ -36,8 +56,58 @@ class InputEncoding(MultiCaseGate, ABC):
     def gate_count(self) -> int:
         return len(self._targets)
 
+    @property
+    def initial_states(self) -> np.ndarray:
+        """The states the case circuits prepare from the all-zero
+        state, of shape (case count, 2**qubit_num).
+        """
+        if self._initial_states is None:
+            self._initial_states = self.build_initial_states(
+                self._circuits, len(self._targets)
+            )
+            # Shared between encodings, so they must not be changed.
+            self._initial_states.flags.writeable = False
+
+        return self._initial_states
+
+    def build_initial_states(
+        self, circuits: List[Circuit], qubit_num: int
+    ) -> np.ndarray:
+        """Simulate the case circuits. Can be overwritten by encodings
+        whose states can be constructed directly.
+        """
+        simulator = QuaSim()
+
+        initial_states = np.empty((len(circuits), 2**qubit_num), dtype=np.complex128)
+        for i, case_circuit in enumerate(circuits):
+            # Evaluated on a new circuit, since the simulator stores
+            # the state in the circuit.
+            circuit = Circuit(qubit_num)
+            for gate in case_circuit.gates:
+                circuit.apply(gate)
+
+            simulator.evaluate_circuit(circuit)
+            initial_states[i] = circuit.state
+
+        return initial_states
+
+    @property
+    def initial_state(self) -> np.ndarray:
+        """The state the circuit of the current case prepares
+        from the all-zero state.
+        """
+        return self.initial_states[self._case_index]
+
 
 class InputEncodingConstructor(ABC):
+    """Constructs encodings of the input values.
+
+    The case circuits and initial states are built once per qubit
+    number and shared by all encodings constructed, so constructing
+    an encoding (e.g. when drawing random gates or mutating) does
+    not depend on the number of cases.
+    """
+
     input_values: List[List[int]]
     EncodingType: Type
 
@@ -45,5 +115,17 @@ class InputEncodingConstructor(ABC):
         self.input_values = input_values
         self.EncodingType = EncodingType
 
+        self._cases: Dict[int, Tuple[List[Circuit], np.ndarray]] = {}
+
     def __call__(self, qubit_num: int) -> InputEncoding:
-        return self.EncodingType(qubit_num, self.input_values)
+        if qubit_num not in self._cases:
+            encoding = self.EncodingType(qubit_num, self.input_values)
+            self._cases[qubit_num] = (encoding._circuits, encoding.initial_states)
+
+        circuits, initial_states = self._cases[qubit_num]
+        return self.EncodingType(
+            qubit_num,
+            self.input_values,
+            circuits=circuits,
+            initial_states=initial_states,
+        )
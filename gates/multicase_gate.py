@@ -1,7 +1,8 @@
 #!/usr/bin/env pyhton3
 
 from abc import ABC, abstractmethod
-from typing import List
+from copy import deepcopy
+from typing import Dict, List
 
 from .gate import Gate
 
@@ -17,6 +18,23 @@ class MultiCaseGate(Gate):
 
     _case_index: int = 0
 
+    # Per-case data (e.g. circuits) that is never changed after
+    # construction. Copies of the gate (e.g. clones of chromosomes)
+    # share it instead of copying every case.
+    _shared_attributes: List[str] = []
+
     def set_case_index(self, index: int) -> "MultiCaseGate":
         self._case_index = index
         return self
+
+    def __deepcopy__(self, memo: Dict) -> "MultiCaseGate":
+        gate = self.__class__.__new__(self.__class__)
+        memo[id(self)] = gate
+
+        for attribute, value in vars(self).items():
+            if attribute in self._shared_attributes:
+                setattr(gate, attribute, value)
+            else:
+                setattr(gate, attribute, deepcopy(value, memo))
+
+        return gate
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+from abc import ABC, abstractmethod
+import numpy as np
+from typing import Dict
+from quasim import Circuit
+from quasim.gates import IGate, Gate, CGate, CCGate, Swap, H, X, Y, Z, CX, CY, CZ
+from quasim.gates.utils import (
+    create_matrix,
+    create_controlled_matrix,
+    create_double_controlled_matrix,
+)
+
+# Entries of compiled unitaries below this magnitude are treated
+# as zero, to absorb rounding errors of the matrix products.
+TOLERANCE: float = 1e-12
+
+# Gates of the quasim simulator that are Clifford gates.
+CLIFFORD_GATE_TYPES = [H, X, Y, Z, CX, CY, CZ, Swap]
+
+
+class Operator(ABC):
+    """Precompiled action of a circuit on its qubit_num qubits.
+
+    Operators act on the first qubit_num qubits of a state, which
+    may consist of further (less significant) qubits. The resulting
+    state is written into out, if given, which must not be the
+    state itself.
+    """
+
+    qubit_num: int
+
+    @abstractmethod
+    def apply(self, state: np.ndarray, out: np.ndarray = None) -> np.ndarray: ...
+
+    def _split(self, state: np.ndarray) -> np.ndarray:
+        # Rows index the basis states of the operator qubits,
+        # columns those of the remaining qubits.
+        if state is None:
+            return None
+
+        return state.reshape(2**self.qubit_num, -1)
+
+
+class DiagonalOperator(Operator):
+    """Multiplies every basis state with a phase."""
+
+    phases: np.ndarray
+
+    def __init__(self, phases: np.ndarray) -> None:
+        self.phases = phases
+        self.qubit_num = len(phases).bit_length() - 1
+
+        self._expanded: Dict[int, np.ndarray] = {}
+
+    def apply(self, state: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        return np.multiply(
+            self.phases[:, None], self._split(state), out=self._split(out)
+        ).reshape(-1)
+
+    def expand(self, qubit_num: int) -> np.ndarray:
+        """Return the (read-only) phases of all basis states of
+        qubit_num qubits.
+        """
+        if qubit_num not in self._expanded:
+            phases = np.repeat(self.phases, 2 ** (qubit_num - self.qubit_num))
+            phases.flags.writeable = False
+            self._expanded[qubit_num] = phases
+
+        return self._expanded[qubit_num]
+
+
+class PermutationOperator(Operator):
+    """Permutes the amplitudes of the basis states, so that the
+    amplitude of basis state i is taken from indices[i].
+    """
+
+    indices: np.ndarray
+
+    def __init__(self, indices: np.ndarray) -> None:
+        self.indices = indices
+        self.qubit_num = len(indices).bit_length() - 1
+
+        self._inverse_indices = None
+        self._expanded: Dict[int, np.ndarray] = {}
+
+    @property
+    def inverse_indices(self) -> np.ndarray:
+        """The index each basis state is moved to."""
+        if self._inverse_indices is None:
+            self._inverse_indices = np.argsort(self.indices)
+
+        return self._inverse_indices
+
+    def apply(self, state: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        return np.take(
+            self._split(state), self.indices, axis=0, out=self._split(out)
+        ).reshape(-1)
+
+    def expand(self, qubit_num: int) -> np.ndarray:
+        """Return the (read-only) permutation of all basis states of
+        qubit_num qubits.
+        """
+        if qubit_num not in self._expanded:
+            remaining_num = qubit_num - self.qubit_num
+            lower_indices = np.arange(2**remaining_num)
+
+            indices = (
+                (self.indices[:, None] << remaining_num) | lower_indices[None, :]
+            ).reshape(-1)
+            indices.flags.writeable = False
+            self._expanded[qubit_num] = indices
+
+        return self._expanded[qubit_num]
+
+
+class UnitaryOperator(Operator):
+    matrix: np.ndarray
+
+    def __init__(self, matrix: np.ndarray) -> None:
+        self.matrix = matrix
+        self.qubit_num = len(matrix).bit_length() - 1
+
+    def apply(self, state: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        result = np.matmul(self.matrix, self._split(state), out=self._split(out))
+        return result.reshape(-1)
+
+
+def compute_unitary(circuit: Circuit) -> np.ndarray:
+    unitary = np.eye(2**circuit.qubit_num, dtype=np.complex128)
+
+    for gate in circuit.gates:
+        unitary = create_gate_matrix(gate, circuit.qubit_num) @ unitary
+
+    return unitary
+
+
+def create_gate_matrix(gate: IGate, qubit_num: int) -> np.ndarray:
+    if type(gate) == Swap:
+        indices = np.arange(2**qubit_num).reshape((2,) * qubit_num)
+        indices = np.swapaxes(indices, gate.qubit1, gate.qubit2).reshape(-1)
+        return np.eye(2**qubit_num, dtype=np.complex128)[indices]
+    elif isinstance(gate, Gate):
+        return create_matrix(gate.matrix, gate.target_qubit, qubit_num)
+    elif isinstance(gate, CGate):
+        return create_controlled_matrix(
+            gate.matrix, gate.control_qubit, gate.target_qubit, qubit_num
+        )
+    elif isinstance(gate, CCGate):
+        return create_double_controlled_matrix(
+            gate.matrix,
+            gate.control_qubit1,
+            gate.control_qubit2,
+            gate.target_qubit,
+            qubit_num,
+        )
+
+    raise NotImplementedError(f"Unknown gate type for {gate} ({type(gate)})")
+
+
+def is_clifford_circuit(circuit: Circuit) -> bool:
+    for gate in circuit.gates:
+        if type(gate) not in CLIFFORD_GATE_TYPES:
+            return False
+
+    return True
+
+
+def compile_operator(circuit: Circuit) -> Operator:
+    """Compile a circuit into its cheapest exact representation:
+    a diagonal of phases, a permutation of basis states or, if it
+    is neither, its dense unitary.
+    """
+    unitary = compute_unitary(circuit)
+    is_nonzero = np.abs(unitary) > TOLERANCE
+
+    if not np.any(is_nonzero & ~np.eye(len(unitary), dtype=bool)):
+        return DiagonalOperator(np.diag(unitary).copy())
+
+    if np.all(is_nonzero.sum(axis=1) == 1):
+        indices = np.argmax(is_nonzero, axis=1)
+        if np.all(np.abs(unitary[np.arange(len(unitary)), indices] - 1) < TOLERANCE):
+            return PermutationOperator(indices)
+
+    return UnitaryOperator(unitary)
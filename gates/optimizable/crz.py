@@ -11,6 +11,7 @@ from .optimizable_gate import OptimizableGate
 
 class CRZ(OptimizableGate):
     name: str = "crz"
+    is_diagonal: bool = True
 
     control: int
     target: int
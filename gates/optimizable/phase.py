@@ -11,6 +11,7 @@ from .optimizable_gate import OptimizableGate
 
 class Phase(OptimizableGate):
     name: str = "phase_shift"
+    is_diagonal: bool = True
 
     target: int
     theta: float
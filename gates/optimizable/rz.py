@@ -11,6 +11,7 @@ from .optimizable_gate import OptimizableGate
 
 class RZ(OptimizableGate):
     name: str = "rz"
+    is_diagonal: bool = True
 
     target: int
     theta: float
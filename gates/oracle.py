@@ -6,21 +6,34 @@ from random import sample
 from typing import Any, List
 
 from .multicase_gate import MultiCaseGate
+from .operators import Operator, compile_operator, is_clifford_circuit
 
 
 class Oracle(MultiCaseGate, ABC):
     name: str = "oracle"
     is_oracle: bool = True
+    has_operator: bool = True
 
     _circuits: List[Circuit] = None
+    _operators: List[Operator] = None
     _oracle_qubit_num: int = None
 
+    _shared_attributes: List[str] = ["_circuits", "_operators"]
+
     targets = []
 
     def __init__(
-        self, qubit_num: int, circuits: List[Circuit], oracle_qubit_num: int
+        self,
+        qubit_num: int,
+        circuits: List[Circuit],
+        oracle_qubit_num: int,
+        operators: List[Operator] = None,
     ) -> None:
+        """Operators compiled from the circuits can be passed to
+        share them between oracles (see OracleConstructor).
+        """
         self._circuits = circuits
+        self._operators = operators
         self._oracle_qubit_num = oracle_qubit_num
 
         self._qubit_num = qubit_num
@@ -38,13 +51,45 @@ class Oracle(MultiCaseGate, ABC):
     def __repr__(self) -> str:
         return f"{self.name}({','.join(['target' + str((i + 1)) + '=' + str(target) for i, target in enumerate(self.targets)])})"
 
+    @property
+    def is_clifford(self) -> bool:
+        """Whether the circuits of all cases consist of Clifford gates."""
+        for circuit in self._circuits:
+            if not is_clifford_circuit(circuit):
+                return False
+
+        return True
+
+    @property
+    def operators(self) -> List[Operator]:
+        """The circuits of all cases, compiled into operators on the
+        first qubits of the circuit the oracle is applied to.
+        """
+        if self._operators is None:
+            self._operators = [compile_operator(circuit) for circuit in self._circuits]
+
+        return self._operators
+
+    @property
+    def operator(self) -> Operator:
+        """The operator of the current case."""
+        return self.operators[self._case_index]
+
 
 class OracleConstructor:
+    """Constructs oracles of the case circuits.
+
+    The circuits are compiled into operators once and shared by
+    all oracles constructed.
+    """
+
     _circuits: List[Circuit] = None
+    _operators: List[Operator] = None
     _oracle_qubit_num: int = None
 
     def __init__(self, circuits: List[Circuit]) -> None:
         self._circuits = circuits
+        self._operators = [compile_operator(circuit) for circuit in circuits]
         self._oracle_qubit_num = circuits[0].qubit_num
 
     def __call__(self, qubit_num: int) -> Oracle:
@@ -52,4 +97,5 @@ class OracleConstructor:
             qubit_num=qubit_num,
             circuits=self._circuits,
             oracle_qubit_num=self._oracle_qubit_num,
+            operators=self._operators,
         )
@@ -9,6 +9,8 @@ from .gate import Gate
 
 class Swap(Gate):
     name: str = "swap"
+    is_permutation: bool = True
+    is_clifford: bool = True
 
     target1: int
     target2: int
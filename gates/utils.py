@@ -75,17 +75,24 @@ def extract_ngram_types(
     return gate_types
 
 
-def get_unique_chomosomes(population: List[List[Gate]]) -> List[List[Gate]]:
+def get_unique_chomosomes(
+    population: List[List[Gate]], gate_set: "GateSet" = None
+) -> List[List[Gate]]:
     """Remove duplicate chromosomes based on gate types.
     Qubit ids or parameter values are not taken into account.
     If duplicates are encountered, the chromosome with the lower
     fitness value is chosen.
+    If a gate set is passed, chromosomes are compared by their
+    interned signatures instead of their ngram names.
     """
     # for duplicates ,
     # keep the chromosomes with better (=lower) fitness.
     unique_chromosomes = {}
     for chromosome in population:
-        chromosome_name = construct_ngram_name(chromosome)
+        if gate_set is None:
+            chromosome_name = construct_ngram_name(chromosome)
+        else:
+            chromosome_name = gate_set.chromosome_signature(chromosome)
 
         if chromosome_name in unique_chromosomes:
             if (
@@ -10,6 +10,8 @@ from .gate import Gate
 
 class X(Gate):
     name: str = "x"
+    is_permutation: bool = True
+    is_clifford: bool = True
 
     target: int
 
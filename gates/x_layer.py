@@ -8,6 +8,8 @@ from .gate import Gate
 
 class XLayer(Gate):
     name: str = "x_layer"
+    is_permutation: bool = True
+    is_clifford: bool = True
 
     def __init__(self, qubit_num: int):
         self._qubit_num = qubit_num
@@ -9,6 +9,7 @@ from .gate import Gate
 
 class Y(Gate):
     name: str = "y"
+    is_clifford: bool = True
 
     target: int
 
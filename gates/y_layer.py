@@ -8,6 +8,7 @@ from .gate import Gate
 
 class YLayer(Gate):
     name: str = "y_layer"
+    is_clifford: bool = True
 
     def __init__(self, qubit_num: int):
         self._qubit_num = qubit_num
@@ -9,6 +9,8 @@ from .gate import Gate
 
 class Z(Gate):
     name: str = "z"
+    is_diagonal: bool = True
+    is_clifford: bool = True
 
     target: int
 
@@ -0,0 +1,4 @@
+from .engine import Engine
+from .statevector_engine import StatevectorEngine
+from .classical_engine import ClassicalEngine
+from .stabilizer_engine import StabilizerEngine
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import threading
+from typing import List
+
+# Buffers by qubit number, separately for every thread (and, since
+# module state is not shared, every process) evaluating chromosomes.
+_pools = threading.local()
+
+
+class StateBuffers:
+    """Preallocated arrays for simulating states of qubit_num qubits,
+    which are reused by every simulation of the same thread.
+
+    Gates that cannot be applied in place (e.g. gathers) write into
+    spare, after which state and spare are swapped.
+    """
+
+    qubit_num: int
+    state: np.ndarray
+    spare: np.ndarray
+    # Accumulated phases of runs of diagonal gates.
+    phases: np.ndarray
+    # Composed index arrays of runs of permutation gates, written
+    # alternately since gathers cannot write into their input.
+    indices: List[np.ndarray]
+    probabilities: np.ndarray
+
+    def __init__(self, qubit_num: int) -> None:
+        self.qubit_num = qubit_num
+
+        self.state = np.empty(2**qubit_num, dtype=np.complex128)
+        self.spare = np.empty(2**qubit_num, dtype=np.complex128)
+        self.phases = np.empty(2**qubit_num, dtype=np.complex128)
+        self.indices = [
+            np.empty(2**qubit_num, dtype=np.int64),
+            np.empty(2**qubit_num, dtype=np.int64),
+        ]
+        self.probabilities = np.empty(2**qubit_num, dtype=np.float64)
+
+    def swap(self) -> None:
+        self.state, self.spare = self.spare, self.state
+
+    def spare_indices(self, indices: np.ndarray) -> np.ndarray:
+        """Return an index buffer other than indices."""
+        if indices is self.indices[0]:
+            return self.indices[1]
+
+        return self.indices[0]
+
+
+def get_state_buffers(qubit_num: int) -> StateBuffers:
+    """Return the buffers of the current thread for qubit_num qubits."""
+    if not hasattr(_pools, "buffers"):
+        _pools.buffers = {}
+
+    if qubit_num not in _pools.buffers:
+        _pools.buffers[qubit_num] = StateBuffers(qubit_num)
+
+    return _pools.buffers[qubit_num]
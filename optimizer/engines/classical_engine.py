@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+import numpy as np
+from quasim import Circuit
+from typing import List
+
+from gates import Gate, BinaryEncoding, CompiledChromosome
+from gates.operators import PermutationOperator
+from .engine import CALL_OVERHEAD, Engine
+from .kernels import apply_classical_gate
+
+MAX_QUBIT_NUM: int = 62
+
+
+class ClassicalEngine(Engine):
+    """Simulates chromosomes that only consist of permutation gates
+    (see Gate.is_permutation), binary input encodings and oracles
+    compiled into permutations, i.e. classical reversible circuits.
+
+    Such circuits map basis states onto basis states, so the state
+    of each case is a single basis state index. The indices of all
+    cases are updated at once with bitwise operations, and the
+    resulting distributions are one-hot.
+    """
+
+    name: str = "classical"
+
+    def supports(self, chromosome: CompiledChromosome, qubit_num: int) -> bool:
+        # Basis state indices are int64.
+        if qubit_num > MAX_QUBIT_NUM:
+            return False
+
+        for gate in chromosome.instructions:
+            if type(gate) == BinaryEncoding:
+                continue
+            elif gate.has_operator:
+                for operator in gate.operators:
+                    if type(operator) != PermutationOperator:
+                        return False
+            elif not gate.is_permutation:
+                return False
+
+        return True
+
+    def cost(
+        self,
+        chromosome: CompiledChromosome,
+        qubit_num: int,
+        measurement_qubit_num: int,
+        case_count: int,
+    ) -> float:
+        # Base gates update the basis state indices of all cases at once.
+        return chromosome.gate_count * (CALL_OVERHEAD + case_count) + case_count * (
+            2**measurement_qubit_num
+        )
+
+    def run(
+        self,
+        chromosome: CompiledChromosome,
+        qubit_num: int,
+        measurement_qubit_num: int,
+        case_count: int,
+    ) -> List[np.ndarray]:
+        basis_indices = np.zeros(case_count, dtype=np.int64)
+
+        for gate in chromosome.instructions:
+            if type(gate) == BinaryEncoding:
+                basis_indices ^= gate.flip_masks[:case_count]
+            elif gate.has_operator:
+                basis_indices = self._apply_operators(gate, basis_indices, qubit_num)
+            else:
+                for base_gate in gate.apply_to(Circuit(qubit_num)).gates:
+                    basis_indices = apply_classical_gate(
+                        basis_indices, base_gate, qubit_num
+                    )
+
+        # Ancillary qubits are the least significant bits.
+        measured_indices = basis_indices >> (qubit_num - measurement_qubit_num)
+
+        distributions = np.zeros((case_count, 2**measurement_qubit_num))
+        distributions[np.arange(case_count), measured_indices] = 1
+
+        return list(distributions)
+
+    def _apply_operators(
+        self, gate: Gate, basis_indices: np.ndarray, qubit_num: int
+    ) -> np.ndarray:
+        # Operators differ between cases and act on the leading qubits.
+        for case_index, operator in enumerate(gate.operators[: len(basis_indices)]):
+            remaining_num = qubit_num - operator.qubit_num
+            upper_index = basis_indices[case_index] >> remaining_num
+            lower_index = basis_indices[case_index] & ((1 << remaining_num) - 1)
+
+            basis_indices[case_index] = (
+                operator.inverse_indices[upper_index] << remaining_num
+            ) | lower_index
+
+        return basis_indices
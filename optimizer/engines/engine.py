@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+from abc import ABC, abstractmethod
+import numpy as np
+from typing import List
+
+from gates import CompiledChromosome
+
+# Estimated cost of a numpy call (and the Python code around it)
+# in terms of operations on single array elements, which engines
+# use to estimate the cost of simulating a chromosome.
+CALL_OVERHEAD: float = 1000
+
+
+class Engine(ABC):
+    """Base class of simulation engines, which compute the
+    probabilities of the measured basis states at the end of the
+    circuit of a compiled chromosome for each case.
+
+    Only the first measurement_qubit_num qubits are measured.
+    Ancillary qubits are the less significant ones, so that the
+    probability of a measured basis state sums a contiguous block
+    of basis states of all qubits.
+    """
+
+    name: str
+
+    def supports(self, chromosome: CompiledChromosome, qubit_num: int) -> bool:
+        """Indicate whether the engine can simulate the chromosome
+        exactly.
+        """
+        return True
+
+    @abstractmethod
+    def cost(
+        self,
+        chromosome: CompiledChromosome,
+        qubit_num: int,
+        measurement_qubit_num: int,
+        case_count: int,
+    ) -> float:
+        """Estimate the cost of run in operations on single array
+        elements (see CALL_OVERHEAD), so that the cheapest of the
+        engines supporting a chromosome can be chosen.
+        """
+
+    @abstractmethod
+    def run(
+        self,
+        chromosome: CompiledChromosome,
+        qubit_num: int,
+        measurement_qubit_num: int,
+        case_count: int,
+    ) -> List[np.ndarray]: ...
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+
+from functools import lru_cache
+import numpy as np
+from quasim.gates import IGate, Gate, CGate, CCGate, Swap, X
+from typing import Dict, List, Tuple
+
+# States are vectors of 2**qubit_num amplitudes. Viewed as tensors
+# of shape (2,) * qubit_num, qubit i corresponds to axis i, since
+# qubit 0 is the most significant bit of a basis state index.
+
+
+# Phases of diagonal gates whose matrix does not depend on parameters
+# and index arrays of permutation gates, by gate type, qubits and
+# qubit number.
+_phase_cache: Dict[Tuple, np.ndarray] = {}
+_permutation_cache: Dict[Tuple, np.ndarray] = {}
+
+
+def get_controls(gate: IGate) -> List[int]:
+    """Return the control qubits of a (controlled) single qubit gate
+    of the quasim simulator.
+    """
+    if isinstance(gate, Gate):
+        return []
+    elif isinstance(gate, CGate):
+        return [gate.control_qubit]
+    elif isinstance(gate, CCGate):
+        return [gate.control_qubit1, gate.control_qubit2]
+
+    raise NotImplementedError(f"{gate} ({type(gate)}) is not a single qubit gate.")
+
+
+def is_flip(gate: IGate) -> bool:
+    """Indicate whether a gate of the quasim simulator is a
+    (controlled) X gate.
+    """
+    return type(gate) != Swap and np.array_equal(gate.matrix, X.matrix)
+
+
+def set_zero_state(state: np.ndarray) -> None:
+    state.fill(0)
+    state[0] = 1
+
+
+def probabilities(state: np.ndarray) -> np.ndarray:
+    return state.real**2 + state.imag**2
+
+
+def measure(
+    state: np.ndarray, measurement_qubit_num: int, out: np.ndarray = None
+) -> np.ndarray:
+    """Return the probabilities of the basis states of the first
+    measurement_qubit_num qubits. The probabilities of all basis
+    states are written into out, if given.
+    """
+    if out is None:
+        out = probabilities(state)
+    else:
+        np.absolute(state, out=out)
+        np.square(out, out=out)
+
+    return out.reshape(2**measurement_qubit_num, -1).sum(axis=1)
+
+
+# The following kernels apply gates in place. They use scratch, an
+# array of the size of the state, as temporary storage.
+
+# Single qubit gates are applied as matrix products on blocks of
+# at least this many amplitudes (or on at most this many blocks).
+MIN_BLOCK_SIZE: int = 16
+
+
+def apply_single_qubit_gate(
+    state: np.ndarray,
+    scratch: np.ndarray,
+    matrix: np.ndarray,
+    target: int,
+    qubit_num: int,
+) -> None:
+    # The state consists of block_count blocks (one per value of the
+    # qubits before the target) of two rows (one per value of the
+    # target) of block_size amplitudes.
+    block_size = 2 ** (qubit_num - 1 - target)
+    block_count = 2**target
+
+    if block_size == 1:
+        # A single product of all pairs of amplitudes with the matrix.
+        np.matmul(state.reshape(-1, 2), matrix.T, out=scratch.reshape(-1, 2))
+    elif block_size >= MIN_BLOCK_SIZE or block_count <= MIN_BLOCK_SIZE:
+        # One product of the matrix with each (2, block_size) block.
+        np.matmul(
+            matrix,
+            state.reshape(block_count, 2, block_size),
+            out=scratch.reshape(block_count, 2, block_size),
+        )
+    else:
+        # Many small blocks, for which the matrix products are slower
+        # than combining the amplitudes directly.
+        apply_controlled_gate(state, scratch, matrix, [], target, qubit_num)
+        return
+
+    np.copyto(state, scratch)
+
+
+def apply_controlled_gate(
+    state: np.ndarray,
+    scratch: np.ndarray,
+    matrix: np.ndarray,
+    controls: List[int],
+    target: int,
+    qubit_num: int,
+) -> None:
+    """Apply a single qubit matrix to the target qubit of all basis
+    states in which the control qubits are 1.
+    """
+    tensor = state.reshape((2,) * qubit_num)
+
+    # Views of the basis states in which all controls are 1 and the
+    # target is 0 or 1, respectively. Only these are changed. The
+    # ellipsis keeps views of single amplitudes from being scalars.
+    index = [slice(None)] * qubit_num + [Ellipsis]
+    for control in controls:
+        index[control] = 1
+
+    index[target] = 0
+    amplitudes0 = tensor[tuple(index)]
+    index[target] = 1
+    amplitudes1 = tensor[tuple(index)]
+
+    # Contiguous temporary arrays are faster to write than views.
+    size = amplitudes0.size
+    temp0 = scratch[:size].reshape(amplitudes0.shape)
+    temp1 = scratch[size : 2 * size].reshape(amplitudes0.shape)
+
+    # temp0 = m00 a0 + m01 a1, then a1 = m10 a0 + m11 a1, a0 = temp0.
+    np.multiply(amplitudes0, matrix[0, 0], out=temp0)
+    np.multiply(amplitudes1, matrix[0, 1], out=temp1)
+    np.add(temp0, temp1, out=temp0)
+
+    np.multiply(amplitudes0, matrix[1, 0], out=temp1)
+    np.multiply(amplitudes1, matrix[1, 1], out=amplitudes1)
+    np.add(amplitudes1, temp1, out=amplitudes1)
+
+    np.copyto(amplitudes0, temp0)
+
+
+def apply_swap(
+    state: np.ndarray, scratch: np.ndarray, qubit1: int, qubit2: int, qubit_num: int
+) -> None:
+    tensor = state.reshape((2,) * qubit_num)
+
+    # Only the basis states in which the bits of the qubits differ
+    # are exchanged.
+    index = [slice(None)] * qubit_num + [Ellipsis]
+    index[qubit1], index[qubit2] = 0, 1
+    amplitudes01 = tensor[tuple(index)]
+    index[qubit1], index[qubit2] = 1, 0
+    amplitudes10 = tensor[tuple(index)]
+
+    temp = scratch[: amplitudes01.size].reshape(amplitudes01.shape)
+
+    np.copyto(temp, amplitudes01)
+    np.copyto(amplitudes01, amplitudes10)
+    np.copyto(amplitudes10, temp)
+
+
+def apply_quasim_gate(
+    state: np.ndarray, scratch: np.ndarray, gate: IGate, qubit_num: int
+) -> None:
+    """Apply a gate of the quasim simulator to a state."""
+    if type(gate) == Swap:
+        apply_swap(state, scratch, gate.qubit1, gate.qubit2, qubit_num)
+    elif isinstance(gate, Gate):
+        apply_single_qubit_gate(
+            state, scratch, gate.matrix, gate.target_qubit, qubit_num
+        )
+    elif isinstance(gate, CGate):
+        apply_controlled_gate(
+            state,
+            scratch,
+            gate.matrix,
+            [gate.control_qubit],
+            gate.target_qubit,
+            qubit_num,
+        )
+    elif isinstance(gate, CCGate):
+        apply_controlled_gate(
+            state,
+            scratch,
+            gate.matrix,
+            [gate.control_qubit1, gate.control_qubit2],
+            gate.target_qubit,
+            qubit_num,
+        )
+    else:
+        raise NotImplementedError(f"Unknown gate type for {gate} ({type(gate)})")
+
+
+@lru_cache(maxsize=None)
+def basis_bits(qubit_num: int) -> np.ndarray:
+    """Return the bit of every qubit in every basis state index,
+    of shape (qubit_num, 2**qubit_num).
+    """
+    indices = np.arange(2**qubit_num)
+    shifts = np.arange(qubit_num - 1, -1, -1)
+
+    bits = (indices[None, :] >> shifts[:, None]) & 1
+    bits.flags.writeable = False
+    return bits
+
+
+def diagonal_phases(gate: IGate, qubit_num: int) -> np.ndarray:
+    """Return the phase by which a diagonal gate of the quasim
+    simulator multiplies each basis state.
+    """
+    # Parametrized gates set their matrix per instance.
+    is_constant = type(gate).matrix is not None
+    if is_constant:
+        key = (type(gate), tuple(gate.qubits), qubit_num)
+        if key in _phase_cache:
+            return _phase_cache[key]
+
+    bits = basis_bits(qubit_num)
+    controls = get_controls(gate)
+
+    phases = np.diag(gate.matrix)[bits[gate.target_qubit]]
+    if len(controls) > 0:
+        is_active = np.logical_and.reduce(bits[controls] == 1, axis=0)
+        phases = np.where(is_active, phases, 1)
+
+    if is_constant:
+        phases.flags.writeable = False
+        _phase_cache[key] = phases
+
+    return phases
+
+
+def permutation_indices(gate: IGate, qubit_num: int) -> np.ndarray:
+    """Return the index array of a permutation gate of the quasim
+    simulator, from which the amplitude of each basis state is
+    gathered (X, CX and CCX flip the target bit if the controls are
+    1, Swap exchanges two bits).
+    """
+    key = (type(gate), tuple(gate.qubits), qubit_num)
+    if key in _permutation_cache:
+        return _permutation_cache[key]
+
+    bits = basis_bits(qubit_num)
+    indices = np.arange(2**qubit_num)
+
+    if type(gate) == Swap:
+        mask = (1 << (qubit_num - 1 - gate.qubit1)) | (1 << (qubit_num - 1 - gate.qubit2))
+        is_active = bits[gate.qubit1] != bits[gate.qubit2]
+    elif is_flip(gate):
+        mask = 1 << (qubit_num - 1 - gate.target_qubit)
+        is_active = np.logical_and.reduce(bits[get_controls(gate)] == 1, axis=0)
+    else:
+        raise NotImplementedError(f"{gate} ({type(gate)}) is not a permutation.")
+
+    indices = np.where(is_active, indices ^ mask, indices)
+    indices.flags.writeable = False
+
+    _permutation_cache[key] = indices
+    return indices
+
+
+def apply_classical_gate(
+    basis_indices: np.ndarray, gate: IGate, qubit_num: int
+) -> np.ndarray:
+    """Apply a permutation gate of the quasim simulator to basis
+    states given by their indices, through bitwise operations.
+    """
+    if type(gate) == Swap:
+        shift1 = qubit_num - 1 - gate.qubit1
+        shift2 = qubit_num - 1 - gate.qubit2
+
+        differ = ((basis_indices >> shift1) ^ (basis_indices >> shift2)) & 1
+        return basis_indices ^ (differ * ((1 << shift1) | (1 << shift2)))
+    elif is_flip(gate):
+        is_active = np.ones_like(basis_indices)
+        for control in get_controls(gate):
+            is_active &= (basis_indices >> (qubit_num - 1 - control)) & 1
+
+        return basis_indices ^ (is_active << (qubit_num - 1 - gate.target_qubit))
+
+    raise NotImplementedError(f"{gate} ({type(gate)}) is not a permutation.")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import numpy as np
+from quasim import Circuit
+from typing import List
+
+from gates import CompiledChromosome
+from .engine import CALL_OVERHEAD, Engine
+from .tableau import Tableau
+
+
+class StabilizerEngine(Engine):
+    """Simulates chromosomes that only consist of Clifford gates (see
+    Gate.is_clifford), including binary input encodings and oracles
+    whose circuits are Clifford circuits, on a stabilizer tableau.
+
+    Gates are applied in time polynomial in the number of qubits and
+    no state vector is built, so that only the distributions of the
+    measured qubits are limited in size. The outcomes of measuring a
+    stabilizer state are uniformly distributed over an affine
+    subspace of the measured basis states, which is enumerated.
+    """
+
+    name: str = "stabilizer"
+
+    def supports(self, chromosome: CompiledChromosome, qubit_num: int) -> bool:
+        for gate in chromosome.instructions:
+            if not gate.is_clifford:
+                return False
+
+        return True
+
+    def cost(
+        self,
+        chromosome: CompiledChromosome,
+        qubit_num: int,
+        measurement_qubit_num: int,
+        case_count: int,
+    ) -> float:
+        # Base gates update the columns of their qubits and each
+        # measurement may multiply all rows of the tableau.
+        gate_cost = chromosome.gate_count * (CALL_OVERHEAD + 2 * qubit_num)
+        measurement_cost = measurement_qubit_num * (
+            CALL_OVERHEAD + 2 * qubit_num**2
+        )
+
+        return case_count * (
+            gate_cost + measurement_cost + 2**measurement_qubit_num
+        )
+
+    def run(
+        self,
+        chromosome: CompiledChromosome,
+        qubit_num: int,
+        measurement_qubit_num: int,
+        case_count: int,
+    ) -> List[np.ndarray]:
+        distributions = []
+
+        for case_index in range(case_count):
+            tableau = Tableau(qubit_num)
+
+            for gate in chromosome.instructions:
+                if gate.is_multicase:
+                    gate.set_case_index(case_index)
+
+                for base_gate in gate.apply_to(Circuit(qubit_num)).gates:
+                    tableau.apply(base_gate)
+
+            indices = tableau.measure_all(measurement_qubit_num)
+
+            distribution = np.zeros(2**measurement_qubit_num)
+            distribution[indices] = 1 / len(indices)
+            distributions.append(distribution)
+
+        return distributions
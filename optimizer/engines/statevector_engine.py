@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+
+import numpy as np
+from quasim import Circuit
+from typing import Any, List, Tuple
+
+from gates import Gate, CompiledChromosome
+from gates.operators import DiagonalOperator, PermutationOperator
+from .engine import CALL_OVERHEAD, Engine
+from .buffers import StateBuffers, get_state_buffers
+from .kernels import (
+    apply_quasim_gate,
+    diagonal_phases,
+    measure,
+    permutation_indices,
+    set_zero_state,
+)
+
+# Kinds of instructions, which determine how they are applied.
+DIAGONAL: str = "diagonal"
+PERMUTATION: str = "permutation"
+OPERATOR: str = "operator"
+BASE_GATES: str = "base_gates"
+
+
+class StatevectorEngine(Engine):
+    """Simulates the full state vector of each case.
+
+    Circuits start in the all-zero state. If the first instruction
+    prepares a known initial state from it (see
+    Gate.prepares_initial_state, e.g. input encodings), the
+    simulation of each case starts from that state instead of
+    replaying the gates of the instruction. Gates with precompiled
+    operators (see Gate.has_operator, e.g. oracles) are applied
+    through them. Runs of consecutive diagonal gates (see
+    Gate.is_diagonal) on any qubits are merged into one vector of
+    phases and runs of permutation gates (see Gate.is_permutation)
+    into one index array, each applied in a single pass over the
+    state.
+
+    States are simulated in preallocated buffers of the current
+    thread (see get_state_buffers), to which all gates are applied
+    in place, so that simulations do not allocate state vectors.
+    """
+
+    name: str = "statevector"
+
+    def cost(
+        self,
+        chromosome: CompiledChromosome,
+        qubit_num: int,
+        measurement_qubit_num: int,
+        case_count: int,
+    ) -> float:
+        # Every base gate is a pass over the state vector of each case.
+        return case_count * (chromosome.gate_count + 1) * (CALL_OVERHEAD + 2**qubit_num)
+
+    def run(
+        self,
+        chromosome: CompiledChromosome,
+        qubit_num: int,
+        measurement_qubit_num: int,
+        case_count: int,
+    ) -> List[np.ndarray]:
+        instructions = chromosome.instructions
+
+        prepared = len(instructions) > 0 and instructions[0].prepares_initial_state
+        if prepared:
+            initial_states = instructions[0].initial_states
+            instructions = instructions[1:]
+
+        buffers = get_state_buffers(qubit_num)
+
+        distributions = []
+        for case_index in range(case_count):
+            if prepared:
+                np.copyto(buffers.state, initial_states[case_index])
+            else:
+                set_zero_state(buffers.state)
+
+            self._apply(buffers, instructions, qubit_num, case_index)
+            distributions.append(
+                measure(buffers.state, measurement_qubit_num, out=buffers.probabilities)
+            )
+
+        return distributions
+
+    def _apply(
+        self,
+        buffers: StateBuffers,
+        instructions: List[Gate],
+        qubit_num: int,
+        case_index: int,
+    ) -> None:
+        # Consecutive instructions of the same kind are collected and
+        # applied together: diagonal gates as one vector of phases,
+        # permutation gates as one composed index array and all other
+        # gates through their base gates, which they provide by
+        # applying them to a circuit.
+        pending = None
+
+        for gate in instructions:
+            if gate.is_multicase:
+                gate.set_case_index(case_index)
+
+            kind = self._get_kind(gate)
+
+            if pending is not None and pending[0] != kind:
+                self._apply_pending(buffers, pending, qubit_num)
+                pending = None
+
+            if kind == DIAGONAL:
+                pending = (kind, self._add_phases(gate, pending, buffers, qubit_num))
+            elif kind == PERMUTATION:
+                pending = (kind, self._add_indices(gate, pending, buffers, qubit_num))
+            elif kind == OPERATOR:
+                gate.operator.apply(buffers.state, out=buffers.spare)
+                buffers.swap()
+            else:
+                if pending is None:
+                    pending = (kind, Circuit(qubit_num))
+
+                gate.apply_to(pending[1])
+
+        if pending is not None:
+            self._apply_pending(buffers, pending, qubit_num)
+
+    def _get_kind(self, gate: Gate) -> str:
+        if gate.has_operator:
+            if type(gate.operator) == DiagonalOperator:
+                return DIAGONAL
+            elif type(gate.operator) == PermutationOperator:
+                return PERMUTATION
+
+            return OPERATOR
+        elif gate.is_diagonal:
+            return DIAGONAL
+        elif gate.is_permutation:
+            return PERMUTATION
+
+        return BASE_GATES
+
+    def _add_phases(
+        self,
+        gate: Gate,
+        pending: Tuple[str, np.ndarray],
+        buffers: StateBuffers,
+        qubit_num: int,
+    ) -> np.ndarray:
+        if gate.has_operator:
+            gate_phases = [gate.operator.expand(qubit_num)]
+        else:
+            gate_phases = [
+                diagonal_phases(base_gate, qubit_num)
+                for base_gate in gate.apply_to(Circuit(qubit_num)).gates
+            ]
+
+        # Phases of single gates may be cached, so products are only
+        # written into the phase buffer.
+        phases = None if pending is None else pending[1]
+        for next_phases in gate_phases:
+            if phases is None:
+                phases = next_phases
+            else:
+                phases = np.multiply(phases, next_phases, out=buffers.phases)
+
+        return phases
+
+    def _add_indices(
+        self,
+        gate: Gate,
+        pending: Tuple[str, np.ndarray],
+        buffers: StateBuffers,
+        qubit_num: int,
+    ) -> np.ndarray:
+        if gate.has_operator:
+            gate_indices = [gate.operator.expand(qubit_num)]
+        else:
+            gate_indices = [
+                permutation_indices(base_gate, qubit_num)
+                for base_gate in gate.apply_to(Circuit(qubit_num)).gates
+            ]
+
+        indices = None if pending is None else pending[1]
+        for next_indices in gate_indices:
+            if indices is None:
+                indices = next_indices
+            else:
+                # Gathering with next_indices after gathering with
+                # indices equals one gather with their composition.
+                indices = np.take(
+                    indices, next_indices, out=buffers.spare_indices(indices)
+                )
+
+        return indices
+
+    def _apply_pending(
+        self, buffers: StateBuffers, pending: Tuple[str, Any], qubit_num: int
+    ) -> None:
+        kind, value = pending
+
+        if kind == DIAGONAL:
+            np.multiply(buffers.state, value, out=buffers.state)
+        elif kind == PERMUTATION:
+            np.take(buffers.state, value, out=buffers.spare)
+            buffers.swap()
+        else:
+            for base_gate in value.gates:
+                apply_quasim_gate(buffers.state, buffers.spare, base_gate, qubit_num)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+import numpy as np
+from quasim.gates import IGate, H, X, Y, Z, CX, CY, CZ, Swap
+from typing import List
+
+
+class Tableau:
+    """Stabilizer tableau of a state of qubit_num qubits (see
+    Aaronson and Gottesman, Improved simulation of stabilizer
+    circuits, 2004).
+
+    Rows 0 to qubit_num - 1 hold the destabilizers and rows qubit_num
+    to 2 * qubit_num - 1 the stabilizers as Pauli operators, given by
+    their x and z bits per qubit and their sign bit. Each gate
+    updates the bits of its qubits in all 2 * qubit_num rows, i.e.
+    O(qubit_num) work per gate, vectorized over the rows.
+
+    Measurement outcomes are tracked as affine functions of the
+    random outcomes of earlier measurements, so that all outcomes
+    of a state can be derived from a single pass of measurements
+    (see measure_all).
+    """
+
+    qubit_num: int
+
+    def __init__(self, qubit_num: int) -> None:
+        self.qubit_num = qubit_num
+
+        # The all-zero state, stabilized by Z and destabilized by X
+        # on every qubit.
+        self.x = np.zeros((2 * qubit_num, qubit_num), dtype=bool)
+        self.z = np.zeros((2 * qubit_num, qubit_num), dtype=bool)
+        self.x[np.arange(qubit_num), np.arange(qubit_num)] = True
+        self.z[np.arange(qubit_num) + qubit_num, np.arange(qubit_num)] = True
+
+        self.signs = np.zeros(2 * qubit_num, dtype=bool)
+
+    def apply(self, gate: IGate) -> None:
+        """Apply a Clifford gate of the quasim simulator."""
+        gate_type = type(gate)
+
+        if gate_type == H:
+            self.h(gate.target_qubit)
+        elif gate_type == X:
+            self.signs ^= self.z[:, gate.target_qubit]
+        elif gate_type == Y:
+            self.signs ^= self.x[:, gate.target_qubit] ^ self.z[:, gate.target_qubit]
+        elif gate_type == Z:
+            self.signs ^= self.x[:, gate.target_qubit]
+        elif gate_type == CX:
+            self.cx(gate.control_qubit, gate.target_qubit)
+        elif gate_type == CY:
+            # CY = S CX S^dagger on the target, with S^dagger = S^3.
+            for _ in range(3):
+                self.s(gate.target_qubit)
+            self.cx(gate.control_qubit, gate.target_qubit)
+            self.s(gate.target_qubit)
+        elif gate_type == CZ:
+            self.h(gate.target_qubit)
+            self.cx(gate.control_qubit, gate.target_qubit)
+            self.h(gate.target_qubit)
+        elif gate_type == Swap:
+            for bits in [self.x, self.z]:
+                bits[:, [gate.qubit1, gate.qubit2]] = bits[:, [gate.qubit2, gate.qubit1]]
+        else:
+            raise NotImplementedError(f"{gate} ({gate_type}) is not a Clifford gate.")
+
+    def h(self, qubit: int) -> None:
+        self.signs ^= self.x[:, qubit] & self.z[:, qubit]
+        self.x[:, qubit], self.z[:, qubit] = self.z[:, qubit].copy(), self.x[:, qubit].copy()
+
+    def s(self, qubit: int) -> None:
+        self.signs ^= self.x[:, qubit] & self.z[:, qubit]
+        self.z[:, qubit] ^= self.x[:, qubit]
+
+    def cx(self, control: int, target: int) -> None:
+        self.signs ^= (
+            self.x[:, control]
+            & self.z[:, target]
+            & ~(self.x[:, target] ^ self.z[:, control])
+        )
+        self.x[:, target] ^= self.x[:, control]
+        self.z[:, control] ^= self.z[:, target]
+
+    def measure_all(self, measurement_qubit_num: int) -> List[int]:
+        """Measure the first measurement_qubit_num qubits in the
+        computational basis and return the basis state indices (of
+        the measured qubits) of all outcomes, which are equally
+        likely.
+
+        The tableau is left in the state after the measurement of
+        the outcome in which every random measurement yields 0.
+        """
+        qubit_num = self.qubit_num
+
+        # The sign of every row is an affine function of the random
+        # outcomes: column 0 holds the constant, column i + 1 the
+        # coefficient of the random outcome of qubit i.
+        signs = np.zeros((2 * qubit_num, measurement_qubit_num + 1), dtype=bool)
+        signs[:, 0] = self.signs
+
+        # The outcome with all random outcomes 0 and the outcomes
+        # changed by each random outcome being 1, by its qubit.
+        offset = 0
+        generators = {}
+
+        for qubit in range(measurement_qubit_num):
+            weight = 1 << (measurement_qubit_num - 1 - qubit)
+            stabilizers = np.flatnonzero(self.x[qubit_num:, qubit])
+
+            if len(stabilizers) > 0:
+                # The outcome is random. Every row anticommuting with
+                # Z on the qubit is multiplied with the first such
+                # stabilizer, which is then replaced by Z with the
+                # sign of the outcome.
+                pivot = qubit_num + stabilizers[0]
+
+                rows = np.flatnonzero(self.x[:, qubit])
+                rows = rows[rows != pivot]
+                signs[rows] ^= signs[pivot]
+                signs[rows, 0] ^= self._product_signs(
+                    self.x[pivot], self.z[pivot], self.x[rows], self.z[rows]
+                )
+                self.x[rows] ^= self.x[pivot]
+                self.z[rows] ^= self.z[pivot]
+
+                self.x[pivot - qubit_num] = self.x[pivot]
+                self.z[pivot - qubit_num] = self.z[pivot]
+                signs[pivot - qubit_num] = signs[pivot]
+
+                self.x[pivot] = False
+                self.z[pivot] = False
+                self.z[pivot, qubit] = True
+                signs[pivot] = False
+                signs[pivot, qubit + 1] = True
+
+                generators[qubit] = weight
+            else:
+                # The outcome is determined by the product of the
+                # stabilizers whose destabilizers anticommute with
+                # Z on the qubit.
+                x = np.zeros(qubit_num, dtype=bool)
+                z = np.zeros(qubit_num, dtype=bool)
+                sign = np.zeros(measurement_qubit_num + 1, dtype=bool)
+
+                for row in np.flatnonzero(self.x[:qubit_num, qubit]) + qubit_num:
+                    sign ^= signs[row]
+                    sign[0] ^= self._product_signs(
+                        self.x[row], self.z[row], x[None, :], z[None, :]
+                    )[0]
+                    x ^= self.x[row]
+                    z ^= self.z[row]
+
+                if sign[0]:
+                    offset |= weight
+                for random_qubit in generators:
+                    if sign[random_qubit + 1]:
+                        generators[random_qubit] |= weight
+
+        self.signs = signs[:, 0].copy()
+
+        indices = [offset]
+        for generator in generators.values():
+            indices = indices + [index ^ generator for index in indices]
+
+        return indices
+
+    def _product_signs(
+        self, x1: np.ndarray, z1: np.ndarray, x2: np.ndarray, z2: np.ndarray
+    ) -> np.ndarray:
+        """Return whether multiplying the rows x2, z2 with the Pauli
+        operator x1, z1 (from the left) flips their signs, i.e. adds
+        a factor of -1 (see the function g of Aaronson and Gottesman).
+        """
+        x1 = x1.astype(np.int64)
+        z1 = z1.astype(np.int64)
+        x2 = x2.astype(np.int64)
+        z2 = z2.astype(np.int64)
+
+        exponents = (
+            x1 * z1 * (z2 - x2)
+            + x1 * (1 - z1) * z2 * (2 * x2 - 1)
+            + (1 - x1) * z1 * x2 * (1 - 2 * z2)
+        )
+
+        return exponents.sum(axis=1) % 4 == 2
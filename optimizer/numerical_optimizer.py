@@ -5,7 +5,7 @@ from scipy.optimize import minimize, OptimizeResult
 from typing import List, Tuple, Union
 
 from fitness import Fitness
-from gates import Gate, OptimizableGate
+from gates import Gate, OptimizableGate, compile_chromosome
 from .params import OptimizerParams, default_params
 from .optimizer import Optimizer
 from .utils import (
@@ -54,25 +54,30 @@ class NumericalOptimizer(Optimizer):
     def optimize(
         self, chromosome: List[Gate], fitness: Fitness
     ) -> Tuple[List[Gate], float]:
-        if not has_parametrized_gates(chromosome):
+        # Compile once, since the structure of the chromosome does not
+        # change during the optimization. Only parameter values do,
+        # which are updated on the shared gate instances.
+        compiled_chromosome = compile_chromosome(chromosome)
+
+        if not has_parametrized_gates(compiled_chromosome):
             state_distributions = get_state_distributions(
-                chromosome,
+                compiled_chromosome,
                 params=self.params,
                 case_count=len(self.target_distributions),
             )
 
             fitness_score = fitness.evaluate(
-                state_distributions, self.target_distributions, chromosome
+                state_distributions, self.target_distributions, compiled_chromosome
             )
 
             return chromosome, fitness_score
 
-        initial_params = extract_param_vector(chromosome)
-        bounds = extract_bounds(chromosome)
+        initial_params = extract_param_vector(compiled_chromosome)
+        bounds = extract_bounds(compiled_chromosome)
 
         objective_function = partial(
             evaluate,
-            chromosome=chromosome,
+            chromosome=compiled_chromosome,
             fitness=fitness,
             target_distributions=self.target_distributions,
             params=self.params,
@@ -93,3 +98,14 @@ class NumericalOptimizer(Optimizer):
         fitness_score = optimization_result.fun.tolist()
 
         return chromosome, fitness_score
+
+    def estimate_cost(self, chromosome: List[Gate]) -> float:
+        simulation_cost = super().estimate_cost(chromosome)
+
+        param_count = len(extract_param_vector(chromosome))
+        if param_count == 0:
+            return simulation_cost
+
+        # Nelder-Mead evaluates the initial simplex of param_count + 1
+        # points and at least one point per iteration.
+        return simulation_cost * (param_count + 1 + self.params.max_iter)
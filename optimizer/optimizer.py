@@ -20,3 +20,13 @@ class Optimizer(ABC):
     @abstractmethod
     def optimize(self, chromosome: List[Gate], fitness: Fitness) -> Tuple[List[Gate], float]:
         ...
+
+    def estimate_cost(self, chromosome: List[Gate]) -> float:
+        """Estimate the relative cost of optimizing the chromosome,
+        used to schedule evaluations. By default, the number of
+        gates simulated across all cases.
+        """
+        gate_count = sum(gate.gate_count for gate in chromosome)
+
+        # Every simulation has a fixed overhead, even without gates.
+        return (gate_count + 1) * len(self.target_distributions)
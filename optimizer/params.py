@@ -12,6 +12,10 @@ class OptimizerParams:
     # tolerance(s) equal to tol."
     tolerance: float = 0
     max_iter: int = 10
+    # Name of the simulation engine to run every chromosome on (see
+    # optimizer.engines), e.g. for debugging or benchmarking. If None,
+    # the cheapest engine that simulates a chromosome exactly is chosen.
+    engine: str = None
 
 
 default_params = OptimizerParams()
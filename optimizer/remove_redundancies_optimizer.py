@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from typing import List, Tuple
 
 from fitness import Fitness
-from gates import Gate, Identity, GateSet
+from gates import Gate, Identity, GateSet, compile_chromosome
 from .params import OptimizerParams, default_params
 from .optimizer import Optimizer
 from .utils import (
@@ -35,12 +35,16 @@ class RemoveRedundanciesOptimizer(Optimizer):
                 chromosome[i] = Identity(qubit_num=self.params.qubit_num)
                 chromosome[i + 1] = Identity(qubit_num=self.params.qubit_num)
 
+        compiled_chromosome = compile_chromosome(chromosome)
+
         state_distributions: List[List[float]] = get_state_distributions(
-            chromosome, params=self.params, case_count=len(self.target_distributions)
+            compiled_chromosome,
+            params=self.params,
+            case_count=len(self.target_distributions),
         )
 
         fitness_score = fitness.evaluate(
-            state_distributions, self.target_distributions, chromosome
+            state_distributions, self.target_distributions, compiled_chromosome
         )
 
         return chromosome, fitness_score
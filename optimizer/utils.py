@@ -1,11 +1,57 @@
 #!/usr/bin/env python3
 
+from dataclasses import dataclass
+import numpy as np
 from quasim import Circuit, QuaSim
-from typing import List, Union, Tuple
+import threading
+import time
+from typing import Dict, List, Union, Tuple
 
 from fitness import Fitness
-from gates import Gate, MultiCaseGate, InputEncoding, Oracle, OptimizableGate
+from gates import (
+    Gate,
+    MultiCaseGate,
+    InputEncoding,
+    Oracle,
+    OptimizableGate,
+    CompiledChromosome,
+    compile_chromosome,
+)
 from .params import OptimizerParams
+from .engines import Engine, ClassicalEngine, StabilizerEngine, StatevectorEngine
+
+CLASSICAL_ENGINE = ClassicalEngine()
+STABILIZER_ENGINE = StabilizerEngine()
+STATEVECTOR_ENGINE = StatevectorEngine()
+
+# The statevector engine supports every chromosome.
+ENGINES: Dict[str, Engine] = {
+    engine.name: engine
+    for engine in [CLASSICAL_ENGINE, STABILIZER_ENGINE, STATEVECTOR_ENGINE]
+}
+
+
+@dataclass
+class EngineStats:
+    # Number of chromosomes the engine has been chosen for.
+    run_count: int = 0
+    # Time spent simulating them, in seconds.
+    total_time: float = 0.0
+
+
+# Statistics of the engines chosen by get_state_distributions, by
+# engine name, separately for every thread (and process), so that
+# workers can report them along with their results without sharing
+# counters (see collect_engine_stats).
+_engine_stats = threading.local()
+
+
+def collect_engine_stats() -> Dict[str, EngineStats]:
+    """Return and reset the engine statistics of the current thread."""
+    stats = getattr(_engine_stats, "stats", {})
+    _engine_stats.stats = {}
+
+    return stats
 
 
 def run_circuit(circuit: Circuit) -> List[float]:
@@ -21,7 +67,15 @@ def build_circuit(
 ) -> Circuit:
     circuit = Circuit(qubit_num)
 
-    for gate in chromosome:
+    # Compiled chromosomes provide a compacted list of gates that
+    # skips gates without effect on the circuit.
+    gates = (
+        chromosome.instructions
+        if type(chromosome) == CompiledChromosome
+        else chromosome
+    )
+
+    for gate in gates:
         if gate.is_multicase:
             gate.set_case_index(case_index)
 
@@ -90,26 +144,58 @@ def extract_bounds(chromosome: List[Gate]) -> List[Union[Tuple[float, float], No
     return bounds
 
 
+def select_engine(
+    chromosome: CompiledChromosome, params: OptimizerParams, case_count: int = 1
+) -> Engine:
+    """Return the engine forced by the params or else the cheapest
+    engine that simulates the chromosome exactly (see Engine.cost).
+    """
+    if params.engine is not None:
+        if params.engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{params.engine}'.")
+
+        engine = ENGINES[params.engine]
+        if not engine.supports(chromosome, params.qubit_num):
+            raise ValueError(
+                f"The {engine.name} engine cannot simulate {chromosome.instructions}."
+            )
+
+        return engine
+
+    engines = [
+        engine
+        for engine in ENGINES.values()
+        if engine.supports(chromosome, params.qubit_num)
+    ]
+
+    return min(
+        engines,
+        key=lambda engine: engine.cost(
+            chromosome, params.qubit_num, params.measurement_qubit_num, case_count
+        ),
+    )
+
+
 def get_state_distributions(
     chromosome: List[Gate], params: OptimizerParams, case_count: int = 1
 ):
-    state_distributions: List[List[float]] = []
+    chromosome = compile_chromosome(chromosome)
+    engine = select_engine(chromosome, params, case_count)
 
-    for i in range(case_count):
-        circuit = build_circuit(
-            chromosome,
-            qubit_num=params.qubit_num,
-            case_index=i,
-        )
+    started_at = time.perf_counter()
+    distributions = engine.run(
+        chromosome, params.qubit_num, params.measurement_qubit_num, case_count
+    )
 
-        state_distribution = run_circuit(circuit)
+    if not hasattr(_engine_stats, "stats"):
+        _engine_stats.stats = {}
 
-        state_distribution = aggregate_state_distribution(
-            state_distribution,
-            measurement_qubit_num=params.measurement_qubit_num,
-            ancillary_num=params.qubit_num - params.measurement_qubit_num,
-        )
+    stats = _engine_stats.stats.setdefault(engine.name, EngineStats())
+    stats.run_count += 1
+    stats.total_time += time.perf_counter() - started_at
 
-        state_distributions.append(state_distribution)
+    state_distributions: List[List[float]] = [
+        distribution.tolist() for distribution in distributions
+    ]
 
     return state_distributions
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import dataclasses
+import pytest
+
+from fitness import Jensensshannon
+from ga import GA, GAParams
+from ga.checkpoint import MAGIC, VERSION, read_checkpoint
+from ga.executors import ThreadExecutor
+from gates import GateSet, H, X, CX, CZ, RY, CombinedGateConstructor
+from optimizer import NumericalOptimizer, OptimizerParams
+
+PARAMS = GAParams(
+    population_size=20,
+    generations=6,
+    chromosome_length=4,
+    swap_gate_mutation_prob=0.1,
+    elitism_percentage=0.1,
+    log_average_fitness=False,
+    fitness_threshold=-1,
+    seed=7,
+)
+
+
+def run_ga(params, checkpoint_path=None):
+    gate_set = GateSet([H, X, CX, CZ, RY], qubit_num=2)
+    # Added gates are restored from the checkpoint.
+    gate_set.append(CombinedGateConstructor([H, CX]))
+
+    optimizer = NumericalOptimizer([[0.5, 0, 0, 0.5]], OptimizerParams(2, 2, max_iter=3))
+
+    with ThreadExecutor(2) as executor:
+        ga = GA(gate_set, Jensensshannon(), optimizer, params=params, executor=executor)
+
+        if checkpoint_path is None:
+            ga.run()
+        else:
+            ga.resume(checkpoint_path)
+
+    return [
+        (str(chromosome), fitness_value)
+        for chromosome, fitness_value in ga.get_best_chromosomes(5)
+    ]
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    checkpoint_path = str(tmp_path / "run.ckpt")
+
+    expected = run_ga(PARAMS)
+
+    # Interrupted after the checkpoint of generation 3.
+    run_ga(
+        dataclasses.replace(
+            PARAMS, generations=3, checkpoint_path=checkpoint_path, checkpoint_interval=3
+        )
+    )
+    assert read_checkpoint(checkpoint_path).generation == 3
+
+    assert run_ga(PARAMS, checkpoint_path=checkpoint_path) == expected
+
+
+@pytest.mark.parametrize(
+    "header, message",
+    [
+        (b"NOT-A-CHECKPOINT" + VERSION.to_bytes(1, "big"), "not a checkpoint file"),
+        (MAGIC + (VERSION + 1).to_bytes(1, "big"), "Unsupported checkpoint version"),
+    ],
+)
+def test_invalid_checkpoint_is_rejected(tmp_path, header, message):
+    checkpoint_path = tmp_path / "run.ckpt"
+    checkpoint_path.write_bytes(header + b"data")
+
+    with pytest.raises(ValueError, match=message):
+        read_checkpoint(str(checkpoint_path))
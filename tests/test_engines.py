@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+import numpy as np
+import pytest
+import random
+from quasim import Circuit
+from quasim.gates import CCZ as QuasimCCZ, CX as QuasimCX, CZ as QuasimCZ
+from quasim.gates import H as QuasimH, X as QuasimX, Y as QuasimY
+
+from gates import *
+from gates.compiled_chromosome import compile_chromosome
+from optimizer import OptimizerParams
+from optimizer.utils import (
+    ENGINES,
+    aggregate_state_distribution,
+    build_circuit,
+    get_state_distributions,
+    run_circuit,
+)
+
+CASE_COUNT = 4
+CHROMOSOME_COUNT = 60
+
+
+def simulate_reference(chromosome, params):
+    """Simulate every case on the full quasim circuit."""
+    distributions = []
+
+    for case_index in range(CASE_COUNT):
+        circuit = build_circuit(
+            compile_chromosome(chromosome), params.qubit_num, case_index
+        )
+        distributions.append(
+            aggregate_state_distribution(
+                run_circuit(circuit),
+                params.measurement_qubit_num,
+                params.qubit_num - params.measurement_qubit_num,
+            )
+        )
+
+    return distributions
+
+
+def create_oracles(qubit_num):
+    """Return diagonal (Grover), permutation (Bernstein-Vazirani),
+    Clifford and dense oracles with one circuit per case.
+    """
+    diagonal, permutation, clifford, dense = [], [], [], []
+
+    for case_index in range(CASE_COUNT):
+        circuit = Circuit(qubit_num)
+        bits = [random.randint(0, 1) for _ in range(qubit_num)]
+        for qubit, bit in enumerate(bits):
+            if bit == 0:
+                circuit.apply(QuasimX(qubit))
+        circuit.apply(QuasimCCZ(0, 1, 2))
+        for qubit, bit in enumerate(bits):
+            if bit == 0:
+                circuit.apply(QuasimX(qubit))
+        diagonal.append(circuit)
+
+        circuit = Circuit(qubit_num)
+        for qubit in range(qubit_num - 1):
+            if random.random() < 0.5:
+                circuit.apply(QuasimCX(qubit, qubit_num - 1))
+        permutation.append(circuit)
+
+        circuit = Circuit(qubit_num)
+        circuit.apply(QuasimH(0))
+        circuit.apply(QuasimCZ(0, 1))
+        circuit.apply(QuasimY(1))
+        clifford.append(circuit)
+
+        circuit = Circuit(qubit_num)
+        circuit.apply(QuasimH(case_index % qubit_num))
+        circuit.apply(QuasimCCZ(0, 1, 2))
+        dense.append(circuit)
+
+    return [
+        OracleConstructor(diagonal),
+        OracleConstructor(permutation),
+        OracleConstructor(clifford),
+        OracleConstructor(dense),
+    ]
+
+
+def create_gate_set(qubit_num):
+    binary_values = [
+        [random.randint(0, 1) for _ in range(qubit_num)] for _ in range(CASE_COUNT)
+    ]
+    angle_values = [
+        [3 * random.random() for _ in range(qubit_num)] for _ in range(CASE_COUNT)
+    ]
+    binary_encoding = InputEncodingConstructor(binary_values, BinaryEncoding)
+
+    gates = [H, X, Y, Z, RX, RY, RZ, Phase, Identity, Swap]
+    gates += [CX, CY, CZ, CH, CRX, CRY, CRZ, CCX, CCZ]
+    gates += [HLayer, XLayer, YLayer, ZLayer, SwapLayer]
+    oracles = create_oracles(qubit_num)
+    gates += oracles
+    gates += [
+        binary_encoding,
+        InputEncodingConstructor(angle_values, RYEncoding),
+        InputEncodingConstructor(angle_values, PhaseEncoding),
+    ]
+    gates += [
+        CombinedGateConstructor([H, CY]),
+        CombinedGateConstructor([X, CCX, Swap]),
+        CombinedGateConstructor([oracles[1], Z]),
+    ]
+
+    return GateSet(gates, qubit_num=qubit_num), binary_encoding
+
+
+@pytest.mark.parametrize("engine", ["statevector", "classical", "stabilizer"])
+@pytest.mark.parametrize("qubit_num, measurement_qubit_num", [(3, 3), (4, 2), (5, 1)])
+def test_engine_matches_reference(engine, qubit_num, measurement_qubit_num):
+    random.seed(qubit_num * 10 + measurement_qubit_num)
+    np.random.seed(qubit_num * 10 + measurement_qubit_num)
+
+    gate_set, binary_encoding = create_gate_set(qubit_num)
+    params = OptimizerParams(
+        qubit_num=qubit_num, measurement_qubit_num=measurement_qubit_num, engine=engine
+    )
+
+    supported_count = 0
+    for _ in range(20 * CHROMOSOME_COUNT):
+        # Classical and Clifford chromosomes are rare among random
+        # ones, so their gates are drawn from the supported gates.
+        chromosome = []
+        for _ in range(random.randint(0, 8)):
+            gate = gate_set.random_gate()
+            if engine == "statevector" or ENGINES[engine].supports(
+                compile_chromosome([gate]), qubit_num
+            ):
+                chromosome.append(gate)
+        if random.random() < 0.5:
+            chromosome.insert(0, binary_encoding(qubit_num))
+
+        if not ENGINES[engine].supports(compile_chromosome(chromosome), qubit_num):
+            continue
+
+        expected = np.array(simulate_reference(chromosome, params))
+        actual = np.array(get_state_distributions(chromosome, params, CASE_COUNT))
+        assert np.allclose(actual, expected, atol=1e-9), chromosome
+
+        supported_count += 1
+        if supported_count == CHROMOSOME_COUNT:
+            break
+
+    assert supported_count == CHROMOSOME_COUNT
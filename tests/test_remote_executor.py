@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+import math
+import pytest
+
+from ga.executors import LocalCluster, RemoteExecutor
+
+
+@pytest.fixture
+def executor():
+    # Port 0 picks a free port.
+    executor = RemoteExecutor(port=0)
+
+    with LocalCluster(executor, worker_count=2):
+        yield executor
+        executor.close()
+
+
+def test_map_returns_results_in_order(executor):
+    items = list(range(-20, 20))
+
+    assert executor.map(abs, items) == [abs(item) for item in items]
+
+
+def test_worker_error_reaches_caller(executor):
+    with pytest.raises(ValueError, match="math domain error"):
+        executor.map(math.sqrt, [4, -1, 9] * 10)
+
+    # The remaining tasks of the failed call do not leak into later calls.
+    assert executor.map(math.sqrt, [4, 9]) == [2, 3]
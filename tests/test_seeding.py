@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+import pytest
+
+from fitness import Jensensshannon
+from ga import GA, GAParams
+from ga.executors import PoolExecutor, ThreadExecutor
+from gates import GateSet, H, X, CX, CZ, RY
+from optimizer import NumericalOptimizer, OptimizerParams
+
+PARAMS = GAParams(
+    population_size=20,
+    generations=4,
+    chromosome_length=4,
+    swap_gate_mutation_prob=0.1,
+    log_average_fitness=False,
+    fitness_threshold=-1,
+    seed=11,
+)
+
+
+def run_ga(executor):
+    gate_set = GateSet([H, X, CX, CZ, RY], qubit_num=2)
+    optimizer = NumericalOptimizer([[0.5, 0, 0, 0.5]], OptimizerParams(2, 2, max_iter=3))
+
+    with executor:
+        ga = GA(gate_set, Jensensshannon(), optimizer, params=PARAMS, executor=executor)
+        ga.run()
+
+    chromosome, fitness_value = ga.get_best_chromosomes(1)[0]
+    return str(chromosome), fitness_value
+
+
+@pytest.mark.parametrize(
+    "create_executor",
+    [lambda: PoolExecutor(2), lambda: ThreadExecutor(3)],
+    ids=["pool", "threads"],
+)
+def test_seeded_run_does_not_depend_on_executor(create_executor):
+    assert run_ga(create_executor()) == run_ga(PoolExecutor(1))
@@ -1,17 +1,21 @@
 #!/usr/bin/env python3
 
 from datetime import datetime
+from functools import lru_cache
 import os
 import subprocess
-from typing import List, Any
+from threading import Event, Lock, Thread
+from typing import Dict, List, Any, Tuple
 
 from gates import Gate
 from ga import GA
 
 
+# The commit does not change during a run, so it is only resolved once.
+@lru_cache(maxsize=None)
 def get_last_commit_id() -> str:
     result = subprocess.run(["git", "rev-parse", "HEAD"], stdout=subprocess.PIPE)
-    result = result.stdout.decode("utf-8")
+    result = result.stdout.decode("utf-8").strip()
     return result
 
 
@@ -19,18 +23,21 @@ def get_timestamp() -> str:
     return datetime.now().isoformat()
 
 
-def log_experiment_details(
-    ga: GA,
-    experiment_id: str,
-    target_path: str = "experiments.csv",
-    description: str = "",
-) -> None:
-    header_row = "experiment_id; description; ga_params; gate_set; fitness; fitness_params; optimizer; optimizer_params; created_at; last_commit_id"
-
+def append_rows(target_path: str, header_row: str, rows: List[str]) -> None:
     if not os.path.exists(target_path):
         with open(target_path, "w") as target_file:
             target_file.write(header_row)
 
+    with open(target_path, "a") as target_file:
+        target_file.write("".join(["\n" + row for row in rows]))
+
+
+EXPERIMENT_DETAILS_HEADER_ROW: str = "experiment_id; description; ga_params; gate_set; fitness; fitness_params; optimizer; optimizer_params; created_at; last_commit_id"
+
+
+def get_experiment_details(
+    ga: GA, experiment_id: str, description: str = ""
+) -> List[str]:
     created_at: str = get_timestamp()
     last_commit_id: str = get_last_commit_id()
 
@@ -46,26 +53,35 @@ def log_experiment_details(
         created_at,
         last_commit_id,
     ]
+    return components
 
-    with open(target_path, "a") as target_file:
-        row = "; ".join(components)
-        target_file.write("\n" + row)
 
+def format_experiment_details(
+    ga: GA, experiment_id: str, description: str = ""
+) -> str:
+    return "; ".join(get_experiment_details(ga, experiment_id, description=description))
 
-def log_fitness(
+
+def log_experiment_details(
+    ga: GA,
+    experiment_id: str,
+    target_path: str = "experiments.csv",
+    description: str = "",
+) -> None:
+    row = format_experiment_details(ga, experiment_id, description=description)
+    append_rows(target_path, EXPERIMENT_DETAILS_HEADER_ROW, [row])
+
+
+FITNESS_HEADER_ROW: str = "experiment_id; generation; best_fitness_value; mean_fitness_value; best_chromosome; created_at"
+
+
+def format_fitness(
     experiment_id: str,
     generation: int,
     best_fitness_value: float,
     mean_fitness_value: float,
     best_chromosome: List[Gate],
-    target_path: str = "fitness_values.csv",
-) -> None:
-    header_row = "experiment_id; generation; best_fitness_value; mean_fitness_value; best_chromosome; created_at"
-
-    if not os.path.exists(target_path):
-        with open(target_path, "w") as target_file:
-            target_file.write(header_row)
-
+) -> str:
     created_at: str = get_timestamp()
 
     components = [
@@ -76,44 +92,227 @@ def log_fitness(
         str(best_chromosome),
         created_at,
     ]
+    return "; ".join(components)
 
-    with open(target_path, "a") as target_file:
-        row = "; ".join(components)
-        target_file.write("\n" + row)
+
+def log_fitness(
+    experiment_id: str,
+    generation: int,
+    best_fitness_value: float,
+    mean_fitness_value: float,
+    best_chromosome: List[Gate],
+    target_path: str = "fitness_values.csv",
+) -> None:
+    row = format_fitness(
+        experiment_id,
+        generation,
+        best_fitness_value,
+        mean_fitness_value,
+        best_chromosome,
+    )
+    append_rows(target_path, FITNESS_HEADER_ROW, [row])
 
 
 GATE_ADDED_EVENT: str = "GATE_ADDED_EVENT"
 ALGORITHM_RESTART_EVENT: str = "ALGORITHM_RESTART_EVENT"
 
 
-def log_event(
-    experiment_id: str,
-    event_type: str,
-    payload: Any = None,
-    target_path: str = "events.csv",
-) -> None:
-    header_row = "experiment_id; event_type; payload; created_at"
+EVENT_HEADER_ROW: str = "experiment_id; event_type; payload; created_at"
 
-    if not os.path.exists(target_path):
-        with open(target_path, "w") as target_file:
-            target_file.write(header_row)
-
-    created_at: str = get_timestamp()
 
+def format_payload(payload: Any = None) -> str:
     if payload is None:
-        payload = ""
+        return ""
     elif type(payload) == str:
-        payload = '"' + payload + '"'
+        return '"' + payload + '"'
     else:
-        payload = str(payload)
+        return str(payload)
+
+
+def format_event(experiment_id: str, event_type: str, payload: Any = None) -> str:
+    created_at: str = get_timestamp()
 
     components = [
         experiment_id,
         event_type,
-        payload,
+        format_payload(payload),
         created_at,
     ]
+    return "; ".join(components)
 
-    with open(target_path, "a") as target_file:
-        row = "; ".join(components)
-        target_file.write("\n" + row)
+
+def log_event(
+    experiment_id: str,
+    event_type: str,
+    payload: Any = None,
+    target_path: str = "events.csv",
+) -> None:
+    row = format_event(experiment_id, event_type, payload=payload)
+    append_rows(target_path, EVENT_HEADER_ROW, [row])
+
+
+class ExperimentLogger:
+    """Logs the rows of one experiment in batches.
+
+    Rows are formatted immediately, but only buffered in memory.
+    A background thread appends them to their files every
+    flush_interval seconds or as soon as batch_size rows have
+    been buffered, so that logging does not block the generations
+    of the genetic algorithm. Call close (or attach the logger
+    to the GA) to write the remaining rows. Logging to a closed
+    logger reopens it, after which it has to be closed again.
+
+    Errors raised while writing on the background thread are
+    re-raised by the next call to a log method or close. Rows that
+    could not be written stay buffered and are retried by the next
+    flush.
+    """
+
+    experiment_id: str
+    flush_interval: float
+    batch_size: int
+
+    def __init__(
+        self, experiment_id: str, flush_interval: float = 5.0, batch_size: int = 100
+    ) -> None:
+        self.experiment_id = experiment_id
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        # Rows per target path, along with the header row of the file.
+        self._rows: Dict[Tuple[str, str], List[str]] = {}
+        self._row_count = 0
+        self._rows_lock = Lock()
+        # Keeps concurrent flushes from writing batches out of order.
+        self._write_lock = Lock()
+
+        self._flush_requested = Event()
+        self._closed = True
+        self._thread = None
+        self._error = None
+        # Keeps concurrent log calls from reopening the logger twice.
+        self._open_lock = Lock()
+
+        # Resolve the run metadata up front rather than when
+        # logging the experiment details.
+        get_last_commit_id()
+
+        self._open()
+
+    def attach(self, ga: GA) -> None:
+        """Close the logger once the GA has completed."""
+        ga.on_completion(lambda *args: self.close())
+
+    def log_experiment_details(
+        self, ga: GA, target_path: str = "experiments.csv", description: str = ""
+    ) -> None:
+        row = format_experiment_details(ga, self.experiment_id, description=description)
+        self._buffer(target_path, EXPERIMENT_DETAILS_HEADER_ROW, row)
+
+    def log_fitness(
+        self,
+        generation: int,
+        best_fitness_value: float,
+        mean_fitness_value: float,
+        best_chromosome: List[Gate],
+        target_path: str = "fitness_values.csv",
+    ) -> None:
+        row = format_fitness(
+            self.experiment_id,
+            generation,
+            best_fitness_value,
+            mean_fitness_value,
+            best_chromosome,
+        )
+        self._buffer(target_path, FITNESS_HEADER_ROW, row)
+
+    def log_event(
+        self, event_type: str, payload: Any = None, target_path: str = "events.csv"
+    ) -> None:
+        row = format_event(self.experiment_id, event_type, payload=payload)
+        self._buffer(target_path, EVENT_HEADER_ROW, row)
+
+    def flush(self) -> None:
+        """Write all buffered rows."""
+        with self._write_lock:
+            with self._rows_lock:
+                rows = self._rows
+                self._rows = {}
+                self._row_count = 0
+
+            unwritten_rows = {}
+            error = None
+
+            for (target_path, header_row), target_rows in rows.items():
+                try:
+                    append_rows(target_path, header_row, target_rows)
+                except Exception as e:
+                    unwritten_rows[(target_path, header_row)] = target_rows
+                    if error is None:
+                        error = e
+
+            if error is not None:
+                # Unwritten rows are retried by the next flush, ahead
+                # of the rows buffered in the meantime.
+                with self._rows_lock:
+                    for key, target_rows in self._rows.items():
+                        unwritten_rows.setdefault(key, []).extend(target_rows)
+
+                    self._rows = unwritten_rows
+                    self._row_count = sum(
+                        len(target_rows) for target_rows in unwritten_rows.values()
+                    )
+
+                raise error
+
+    def close(self) -> None:
+        with self._open_lock:
+            if not self._closed:
+                self._closed = True
+                self._flush_requested.set()
+                self._thread.join()
+                self._thread = None
+
+                self.flush()
+
+        self._raise_error()
+
+    def _open(self) -> None:
+        with self._open_lock:
+            if not self._closed:
+                return
+
+            self._closed = False
+            self._flush_requested.clear()
+            self._thread = Thread(target=self._flush_periodically, daemon=True)
+            self._thread.start()
+
+    def _buffer(self, target_path: str, header_row: str, row: str) -> None:
+        self._raise_error()
+
+        if self._closed:
+            self._open()
+
+        with self._rows_lock:
+            self._rows.setdefault((target_path, header_row), []).append(row)
+            self._row_count += 1
+            row_count = self._row_count
+
+        if row_count >= self.batch_size:
+            self._flush_requested.set()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed:
+            self._flush_requested.wait(timeout=self.flush_interval)
+            self._flush_requested.clear()
+
+            try:
+                self.flush()
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+from dataclasses import dataclass
+import numpy as np
+import os
+import re
+from typing import Dict, List, Tuple
+
+from gates import Gate, CombinedGate
+from ga import GA
+
+# Each recorded generation is stored as a separate compressed .npz
+# shard in the recording directory, holding one array per column.
+# Reading a generation therefore only requires loading its shard.
+SHARD_NAME: str = "generation_{:06d}.npz"
+SHARD_PATTERN = re.compile(r"generation_(\d+)\.npz")
+
+# Padding of gate, operand and parameter columns.
+NO_GATE: int = -1
+NO_OPERAND: int = -1
+
+# Exact type checks are considerably faster than isinstance checks
+# against numpy's abstract scalar types.
+PARAM_TYPES = {float, np.float64, np.float32}
+OPERAND_TYPES = {int, np.int64, np.int32}
+
+
+@dataclass
+class PopulationSnapshot:
+    generation: int
+    # Shape (population size,).
+    fitness_values: np.ndarray
+    # Gate type ids per chromosome and position, shape
+    # (population size, chromosome length). Ids index gate_type_names.
+    gate_types: np.ndarray
+    # Qubit operands per gene, shape (population size, chromosome
+    # length, max operand count), padded with NO_OPERAND.
+    operands: np.ndarray
+    # Parameter values (e.g. rotation angles) per gene, shape
+    # (population size, chromosome length, max param count),
+    # padded with nan.
+    params: np.ndarray
+    gate_type_names: List[str]
+
+    def gate_type_counts(self) -> Dict[str, int]:
+        ids, counts = np.unique(
+            self.gate_types[self.gate_types != NO_GATE], return_counts=True
+        )
+        return {
+            self.gate_type_names[i]: count.item() for i, count in zip(ids, counts)
+        }
+
+
+def extract_gene(gate: Gate) -> Tuple[List[int], List[float]]:
+    """Extract the qubit operands and parameter values of a gate from
+    its public attributes, in the order in which they were assigned.
+    Combined gates contribute the values of their gates.
+    """
+    if type(gate) == CombinedGate:
+        operands, params = [], []
+        for sub_gate in gate.gates:
+            sub_operands, sub_params = extract_gene(sub_gate)
+            operands.extend(sub_operands)
+            params.extend(sub_params)
+
+        return operands, params
+
+    operands, params = [], []
+    for attribute, value in vars(gate).items():
+        if attribute.startswith("_"):
+            continue
+
+        value_type = type(value)
+        if value_type in PARAM_TYPES:
+            params.append(float(value))
+        elif value_type in OPERAND_TYPES:
+            operands.append(int(value))
+        elif value_type == list:
+            operands.extend([int(operand) for operand in value])
+
+    return operands, params
+
+
+class PopulationRecorder:
+    """Generation callback that records the fitness values and
+    genomes of the population every interval generations.
+
+    Usage: ga.on_after_generation(PopulationRecorder(directory))
+    """
+
+    # Only reads the population, so it can run off the critical
+    # path (see GA.on_after_generation).
+    async_safe: bool = True
+
+    directory: str
+    interval: int
+
+    def __init__(self, directory: str, interval: int = 1) -> None:
+        self.directory = directory
+        self.interval = interval
+
+        self._gate_type_ids: Dict[str, int] = {}
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __call__(
+        self,
+        ga: GA,
+        population: List[List[Gate]],
+        fitness_values: List[float],
+        generation: int,
+    ) -> None:
+        if generation % self.interval != 0:
+            return
+
+        self.record(population, fitness_values, generation)
+
+    def record(
+        self,
+        population: List[List[Gate]],
+        fitness_values: List[float],
+        generation: int,
+    ) -> None:
+        population_size = len(population)
+        chromosome_length = max(
+            [len(chromosome) for chromosome in population], default=0
+        )
+
+        genes = [
+            [extract_gene(gate) for gate in chromosome] for chromosome in population
+        ]
+        operand_count = max(
+            [len(operands) for chromosome in genes for operands, _ in chromosome],
+            default=0,
+        )
+        param_count = max(
+            [len(params) for chromosome in genes for _, params in chromosome],
+            default=0,
+        )
+
+        gate_types = np.full(
+            (population_size, chromosome_length), NO_GATE, dtype=np.int32
+        )
+        operands = np.full(
+            (population_size, chromosome_length, operand_count),
+            NO_OPERAND,
+            dtype=np.int8,
+        )
+        params = np.full(
+            (population_size, chromosome_length, param_count), np.nan, dtype=np.float64
+        )
+
+        for i, chromosome in enumerate(population):
+            for j, gate in enumerate(chromosome):
+                gate_types[i, j] = self._get_gate_type_id(gate.name)
+
+                gene_operands, gene_params = genes[i][j]
+                operands[i, j, : len(gene_operands)] = gene_operands
+                params[i, j, : len(gene_params)] = gene_params
+
+        np.savez_compressed(
+            os.path.join(self.directory, SHARD_NAME.format(generation)),
+            generation=np.array(generation),
+            fitness_values=np.asarray(fitness_values, dtype=np.float64),
+            gate_types=gate_types,
+            operands=operands,
+            params=params,
+            gate_type_names=np.array(list(self._gate_type_ids.keys()), dtype=str),
+        )
+
+    def _get_gate_type_id(self, name: str) -> int:
+        if name not in self._gate_type_ids:
+            self._gate_type_ids[name] = len(self._gate_type_ids)
+
+        return self._gate_type_ids[name]
+
+
+def list_recorded_generations(directory: str) -> List[int]:
+    generations = []
+    for file_name in os.listdir(directory):
+        match = SHARD_PATTERN.fullmatch(file_name)
+        if match is not None:
+            generations.append(int(match.group(1)))
+
+    return sorted(generations)
+
+
+def read_snapshot(directory: str, generation: int) -> PopulationSnapshot:
+    with np.load(os.path.join(directory, SHARD_NAME.format(generation))) as shard:
+        return PopulationSnapshot(
+            generation=shard["generation"].item(),
+            fitness_values=shard["fitness_values"],
+            gate_types=shard["gate_types"],
+            operands=shard["operands"],
+            params=shard["params"],
+            gate_type_names=shard["gate_type_names"].tolist(),
+        )
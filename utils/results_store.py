@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+
+import os
+import sqlite3
+from threading import Event, Lock, Thread
+from typing import Any, Dict, List, Tuple
+
+from gates import Gate
+from ga import GA
+from .logging import (
+    EVENT_HEADER_ROW,
+    EXPERIMENT_DETAILS_HEADER_ROW,
+    FITNESS_HEADER_ROW,
+    append_rows,
+    format_payload,
+    get_experiment_details,
+    get_timestamp,
+)
+
+# Chromosomes are normalized into gate types, gates (a gate type
+# with specific operands and parameters) and the positions of
+# gates within chromosomes, so that each distinct chromosome and
+# gate is stored only once across all experiments.
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS experiments (
+    experiment_id TEXT PRIMARY KEY,
+    description TEXT,
+    ga_params TEXT,
+    gate_set TEXT,
+    fitness TEXT,
+    fitness_params TEXT,
+    optimizer TEXT,
+    optimizer_params TEXT,
+    created_at TEXT,
+    last_commit_id TEXT
+);
+
+CREATE TABLE IF NOT EXISTS gate_types (
+    gate_type_id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS gates (
+    gate_id INTEGER PRIMARY KEY,
+    gate_type_id INTEGER NOT NULL REFERENCES gate_types (gate_type_id),
+    representation TEXT UNIQUE NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS chromosomes (
+    chromosome_id INTEGER PRIMARY KEY,
+    representation TEXT UNIQUE NOT NULL,
+    length INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS chromosome_gates (
+    chromosome_id INTEGER NOT NULL REFERENCES chromosomes (chromosome_id),
+    position INTEGER NOT NULL,
+    gate_id INTEGER NOT NULL REFERENCES gates (gate_id),
+    PRIMARY KEY (chromosome_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS fitness_values (
+    experiment_id TEXT NOT NULL,
+    generation INTEGER NOT NULL,
+    best_fitness_value REAL,
+    mean_fitness_value REAL,
+    best_chromosome_id INTEGER REFERENCES chromosomes (chromosome_id),
+    created_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS events (
+    experiment_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    payload TEXT,
+    created_at TEXT
+);
+
+CREATE INDEX IF NOT EXISTS fitness_values_experiment_generation
+    ON fitness_values (experiment_id, generation);
+CREATE INDEX IF NOT EXISTS fitness_values_generation
+    ON fitness_values (generation);
+CREATE INDEX IF NOT EXISTS events_experiment
+    ON events (experiment_id);
+CREATE INDEX IF NOT EXISTS gates_gate_type
+    ON gates (gate_type_id);
+CREATE INDEX IF NOT EXISTS chromosome_gates_gate
+    ON chromosome_gates (gate_id);
+"""
+
+
+class ResultsStore:
+    """Stores experiment details, fitness traces and events in a
+    SQLite database.
+
+    The database runs in WAL mode, so that analyses can read it
+    while experiments are writing to it. Rows are buffered and
+    inserted in one transaction by a background thread every
+    flush_interval seconds or once batch_size rows are pending,
+    as well as on flush and on close (see attach). Rows of failed
+    transactions stay buffered and are retried by the next flush.
+
+    Errors raised while inserting on the background thread are
+    re-raised by the next call to a log method or close. Logging
+    to a closed store raises a RuntimeError.
+
+    The store is standalone: the experiments log through
+    ExperimentLogger, so it has to be created and attached to a
+    GA explicitly.
+    """
+
+    path: str
+    flush_interval: float
+    batch_size: int
+
+    def __init__(
+        self,
+        path: str = "results/results.db",
+        flush_interval: float = 5.0,
+        batch_size: int = 100,
+    ) -> None:
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        directory = os.path.dirname(path)
+        if directory != "":
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # Durable enough in WAL mode, without syncing on every commit.
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._connection.commit()
+
+        self._experiments: List[Tuple] = []
+        self._fitness_values: List[Tuple] = []
+        self._events: List[Tuple] = []
+        self._rows_lock = Lock()
+        # Guards the connection, which is shared with the flush thread.
+        self._lock = Lock()
+
+        # Ids of gate types, gates and chromosomes that have
+        # already been stored, by name or representation.
+        self._ids: Dict[Tuple[str, str], int] = {}
+
+        self._flush_requested = Event()
+        self._closed = False
+        self._error = None
+
+        self._thread = Thread(target=self._flush_periodically, daemon=True)
+        self._thread.start()
+
+    def attach(self, ga: GA) -> None:
+        """Close the store once the GA has completed."""
+        ga.on_completion(lambda *args: self.close())
+
+    def log_experiment_details(
+        self, ga: GA, experiment_id: str, description: str = ""
+    ) -> None:
+        details = get_experiment_details(ga, experiment_id, description=description)
+        self._buffer("_experiments", tuple(details))
+
+    def log_fitness(
+        self,
+        experiment_id: str,
+        generation: int,
+        best_fitness_value: float,
+        mean_fitness_value: float,
+        best_chromosome: List[Gate],
+    ) -> None:
+        # Chromosomes are normalized on flush, so their gates are
+        # captured now in case they are mutated in the meantime.
+        gates = [(gate.name, repr(gate)) for gate in best_chromosome]
+
+        self._buffer(
+            "_fitness_values",
+            (
+                experiment_id,
+                generation,
+                float(best_fitness_value),
+                float(mean_fitness_value),
+                (gates, str(best_chromosome)),
+                get_timestamp(),
+            ),
+        )
+
+    def log_event(self, experiment_id: str, event_type: str, payload: Any = None) -> None:
+        self._buffer(
+            "_events",
+            (experiment_id, event_type, format_payload(payload), get_timestamp()),
+        )
+
+    def flush(self) -> None:
+        """Insert all buffered rows."""
+        with self._lock:
+            with self._rows_lock:
+                experiments = self._experiments
+                fitness_values = self._fitness_values
+                events = self._events
+                self._experiments = []
+                self._fitness_values = []
+                self._events = []
+
+            ids = dict(self._ids)
+
+            try:
+                with self._connection:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO experiments VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        experiments,
+                    )
+                    self._connection.executemany(
+                        "INSERT INTO fitness_values VALUES (?, ?, ?, ?, ?, ?)",
+                        [
+                            row[:4] + (self._store_chromosome(*row[4]),) + row[5:]
+                            for row in fitness_values
+                        ],
+                    )
+                    self._connection.executemany(
+                        "INSERT INTO events VALUES (?, ?, ?, ?)", events
+                    )
+            except BaseException:
+                # The transaction has been rolled back, so the ids
+                # assigned in it are gone and its rows are pending.
+                self._ids = ids
+
+                with self._rows_lock:
+                    self._experiments = experiments + self._experiments
+                    self._fitness_values = fitness_values + self._fitness_values
+                    self._events = events + self._events
+
+                raise
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._flush_requested.set()
+            self._thread.join()
+
+            try:
+                self.flush()
+            finally:
+                self._connection.close()
+
+        self._raise_error()
+
+    def read_fitness_values(
+        self, experiment_id: str
+    ) -> List[Tuple[int, float, float, str]]:
+        """Return generation, best and mean fitness value and the
+        best chromosome of every logged generation of an experiment.
+        """
+        with self._lock:
+            return self._connection.execute(
+                """
+                SELECT generation, best_fitness_value, mean_fitness_value,
+                    chromosomes.representation
+                FROM fitness_values
+                LEFT JOIN chromosomes
+                    ON chromosomes.chromosome_id = fitness_values.best_chromosome_id
+                WHERE experiment_id = ?
+                ORDER BY generation
+                """,
+                (experiment_id,),
+            ).fetchall()
+
+    def query(self, sql: str, parameters: Tuple = ()) -> List[Tuple]:
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def export_csv(self, directory: str = "results") -> None:
+        """Write the stored results into the semicolon-separated
+        files of utils.logging (experiments.csv, fitness_values.csv
+        and events.csv), replacing existing files.
+        """
+        self.flush()
+
+        exports = [
+            (
+                "experiments.csv",
+                EXPERIMENT_DETAILS_HEADER_ROW,
+                "SELECT * FROM experiments ORDER BY created_at",
+            ),
+            (
+                "fitness_values.csv",
+                FITNESS_HEADER_ROW,
+                """
+                SELECT experiment_id, generation, best_fitness_value,
+                    mean_fitness_value, chromosomes.representation, created_at
+                FROM fitness_values
+                LEFT JOIN chromosomes
+                    ON chromosomes.chromosome_id = fitness_values.best_chromosome_id
+                ORDER BY fitness_values.rowid
+                """,
+            ),
+            ("events.csv", EVENT_HEADER_ROW, "SELECT * FROM events ORDER BY rowid"),
+        ]
+
+        os.makedirs(directory, exist_ok=True)
+
+        for file_name, header_row, sql in exports:
+            target_path = os.path.join(directory, file_name)
+            if os.path.exists(target_path):
+                os.remove(target_path)
+
+            rows = [
+                "; ".join([str(value) for value in row]) for row in self.query(sql)
+            ]
+            append_rows(target_path, header_row, rows)
+
+    def _buffer(self, rows: str, row: Tuple) -> None:
+        self._raise_error()
+
+        if self._closed:
+            raise RuntimeError("The results store has already been closed.")
+
+        with self._rows_lock:
+            getattr(self, rows).append(row)
+            row_count = (
+                len(self._experiments) + len(self._fitness_values) + len(self._events)
+            )
+
+        if row_count >= self.batch_size:
+            self._flush_requested.set()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed:
+            self._flush_requested.wait(timeout=self.flush_interval)
+            self._flush_requested.clear()
+
+            try:
+                self.flush()
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _store_chromosome(
+        self, gates: List[Tuple[str, str]], representation: str
+    ) -> int:
+        chromosome_id = self._ids.get(("chromosome", representation))
+        if chromosome_id is not None:
+            return chromosome_id
+
+        chromosome_id = self._get_id(
+            "chromosome",
+            representation,
+            "INSERT OR IGNORE INTO chromosomes (representation, length) VALUES (?, ?)",
+            (representation, len(gates)),
+            "SELECT chromosome_id FROM chromosomes WHERE representation = ?",
+        )
+
+        gate_ids = []
+        for gate_name, gate_representation in gates:
+            gate_type_id = self._get_id(
+                "gate_type",
+                gate_name,
+                "INSERT OR IGNORE INTO gate_types (name) VALUES (?)",
+                (gate_name,),
+                "SELECT gate_type_id FROM gate_types WHERE name = ?",
+            )
+            gate_ids.append(
+                self._get_id(
+                    "gate",
+                    gate_representation,
+                    "INSERT OR IGNORE INTO gates (gate_type_id, representation) VALUES (?, ?)",
+                    (gate_type_id, gate_representation),
+                    "SELECT gate_id FROM gates WHERE representation = ?",
+                )
+            )
+
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO chromosome_gates VALUES (?, ?, ?)",
+            [(chromosome_id, i, gate_id) for i, gate_id in enumerate(gate_ids)],
+        )
+        return chromosome_id
+
+    def _get_id(
+        self, kind: str, key: str, insert_sql: str, values: Tuple, select_sql: str
+    ) -> int:
+        if (kind, key) not in self._ids:
+            self._connection.execute(insert_sql, values)
+            self._ids[(kind, key)] = self._connection.execute(
+                select_sql, (key,)
+            ).fetchone()[0]
+
+        return self._ids[(kind, key)]